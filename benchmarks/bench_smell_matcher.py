@@ -0,0 +1,64 @@
+"""
+Compares the throughput of the text scan behind `has_a_smell`: the previous per-string
+keyword checks (five substring tests, then six `re.search` calls with patterns rebuilt
+from f-strings) and the precompiled single-pass matcher of `perfumeme.profile`.
+
+Usage:
+    python benchmarks/bench_smell_matcher.py record.json   # a saved PUG-View record
+    python benchmarks/bench_smell_matcher.py --cid 702     # download (or read from cache) a record
+    python benchmarks/bench_smell_matcher.py               # synthetic record of about 5 MB
+"""
+
+import re
+import sys
+import json
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from perfumeme.profile import smell_verdict, ODORLESS_KEYWORDS, ODOR_KEYWORDS, _iter_strings
+from bench_stream_memory import synthetic_record
+
+
+def previous_verdict(text):
+    text = text.lower()
+    if any(kw in text for kw in ODORLESS_KEYWORDS):
+        return False
+    if any(re.search(rf"\b{kw}\b", text) for kw in ODOR_KEYWORDS):
+        return True
+    return None
+
+
+def measure(label, func, strings, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in strings:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {len(strings) / best:12,.0f} strings/s   ({best * 1e3:8.1f} ms)")
+    return best
+
+
+def main(argv):
+    if len(argv) > 2 and argv[1] == "--cid":
+        from perfumeme.utils import _fetch
+        from perfumeme import session
+        cid = int(argv[2])
+        raw = _fetch("pug_view", cid, f"{session.PUBCHEM_BASE_URL}/rest/pug_view/data/compound/{cid}/JSON")
+    elif len(argv) > 1:
+        raw = Path(argv[1]).read_bytes()
+    else:
+        raw = synthetic_record()
+
+    strings = list(_iter_strings(json.loads(raw)["Record"]["Section"]))
+    assert [previous_verdict(s) for s in strings] == [smell_verdict(s) for s in strings]
+    print(f"{len(strings):,} strings")
+    before = measure("per-keyword checks (before)", previous_verdict, strings)
+    after = measure("precompiled matcher (after)", smell_verdict, strings)
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
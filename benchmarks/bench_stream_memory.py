@@ -0,0 +1,73 @@
+"""
+Compares peak memory and time of the two ways of parsing a PUG-View record:
+the full `json.loads` tree used by `get_pubchem_record_sections`, and the
+incremental pruned parse of `perfumeme.streaming` (requires ijson).
+
+Usage:
+    python benchmarks/bench_stream_memory.py record.json   # a saved PUG-View record
+    python benchmarks/bench_stream_memory.py --cid 702     # download (or read from cache) a record
+    python benchmarks/bench_stream_memory.py               # synthetic record of about 5 MB
+"""
+
+import io
+import sys
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from perfumeme.streaming import iter_pruned_sections
+
+
+def synthetic_record(n_sections=60, n_info=40):
+    info = {
+        "ReferenceNumber": 1,
+        "Reference": ["Hazardous Substances Data Bank (HSDB)"] * 3,
+        "Value": {"StringWithMarkup": [{
+            "String": "Colorless liquid with a floral odor; vapor pressure 0.16 mmHg at 25 °C",
+            "Markup": [{"Start": 0, "Length": 9, "URL": "https://pubchem.ncbi.nlm.nih.gov/compound/6549", "Type": "PubChem Internal Link"}] * 4,
+        }]},
+    }
+    sections = [{
+        "TOCHeading": f"Heading {i}",
+        "Description": "Lorem ipsum " * 20,
+        "Section": [{"TOCHeading": f"Sub {i}.{j}", "Information": [info] * n_info} for j in range(3)],
+    } for i in range(n_sections)]
+    return json.dumps({"Record": {"RecordType": "CID", "RecordNumber": 6549, "Section": sections}}).encode("utf-8")
+
+
+def measure(label, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} peak {peak / 1e6:8.1f} MB   time {elapsed * 1e3:8.1f} ms")
+    return result
+
+
+def main(argv):
+    if len(argv) > 2 and argv[1] == "--cid":
+        from perfumeme.utils import _fetch
+        from perfumeme import session
+        cid = int(argv[2])
+        raw = _fetch("pug_view", cid, f"{session.PUBCHEM_BASE_URL}/rest/pug_view/data/compound/{cid}/JSON")
+    elif len(argv) > 1:
+        raw = Path(argv[1]).read_bytes()
+    else:
+        raw = synthetic_record()
+
+    print(f"record size: {len(raw) / 1e6:.1f} MB")
+    full = measure("json.loads (current path)", lambda: json.loads(raw)["Record"]["Section"])
+    del full
+    pruned = measure("streaming pruned parse", lambda: list(iter_pruned_sections(io.BytesIO(raw))))
+    del pruned
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -1,32 +1,59 @@
 from __future__ import annotations
-from perfumeme.main_functions import has_a_smell, is_toxic_skin, evaporation_trace
-from perfumeme.perfume_molecule import match_mol_to_odor, match_molecule_to_perfumes,odor_molecule_perfume, what_notes, get_mol_from_odor
-from perfumeme.utils import get_smiles,get_pubchem_record_sections,get_cid_from_smiles,get_odor,get_pubchem_description,resolve_input_to_smiles_and_cid
-from perfumeme.scraper import load_data_smiles, save_data_smiles,add_molecule,load_data_odor,save_data_odor,add_odor_to_molecules
-from perfumeme.usable_function import usable_in_perfume
+# Public names and the submodule defining each of them. They are imported on first access
+# (PEP 562), so `import perfumeme` stays cheap and matplotlib, pandas or rdkit are only loaded
+# by the functions that need them.
+_LAZY_ATTRIBUTES = {
+    "perfumeme.main_functions": ["has_a_smell", "is_toxic_skin", "evaporation_trace"],
+    "perfumeme.perfume_molecule": [
+        "match_mol_to_odor", "match_molecule_to_perfumes", "odor_molecule_perfume", "what_notes", "get_mol_from_odor",
+        "odor_molecule_perfume_many", "match_molecules_to_perfumes", "get_mols_from_odors", "what_notes_many",
+        "perfumes_with_note",
+    ],
+    "perfumeme.utils": [
+        "get_smiles", "get_pubchem_record_sections", "get_cid_from_smiles", "get_odor", "get_pubchem_description",
+        "get_odors", "resolve_input_to_smiles_and_cid", "resolve_input_to_cid", "resolve_many", "classify_input",
+        "canonicalize_smiles", "merge_sections",
+    ],
+    "perfumeme.resolver": ["resolver_stats"],
+    "perfumeme.scraper": ["load_data_smiles", "save_data_smiles", "add_molecule", "load_data_odor", "save_data_odor", "add_odor_to_molecules"],
+    "perfumeme.usable_function": ["usable_in_perfume"],
+    "perfumeme.context": ["CompoundContext"],
+    "perfumeme.profile": ["CompoundProfile", "extract_profile"],
+    "perfumeme.evaporation": ["EvaporationProfile", "evaporation_profile", "evaporation_curve", "evaporation_curves", "plot_evaporation"],
+    "perfumeme.render": ["render_evaporation", "render_many"],
+    "perfumeme.async_functions": ["async_has_a_smell", "async_is_toxic_skin", "async_evaporation_trace", "async_usable_in_perfume", "configure_async"],
+    "perfumeme.session": ["configure_session", "configure_throttle", "get_session"],
+    "perfumeme.cache": ["configure_cache", "clear_cache", "cache_info"],
+    "perfumeme.streaming": ["configure_streaming", "stream_record_sections"],
+    "perfumeme.data": ["ensure_data", "prefetch_data", "data_path", "data_dir"],
+    "perfumeme.database": ["PerfumeDB", "get_default_db", "set_default_db"],
+}
+_LAZY_MODULES = {name: module for module, names in _LAZY_ATTRIBUTES.items() for name in names}
+
+__all__ = sorted(_LAZY_MODULES)
+
+
+def __getattr__(name):
+    import importlib
+
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        # Submodules (perfumeme.utils, perfumeme.scraper...) are imported on first access too.
+        if not name.startswith("__"):
+            try:
+                return importlib.import_module(f"{__name__}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{__name__}.{name}":
+                    raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __version__ = "1.2.4"
-import os
-import requests
-from pathlib import Path
-def _download_if_missing(filename: str, url: str):
-    """Download a data file to ~/.perfumeme if it doesn't exist."""
-    user_data_dir = Path.home() / ".perfumeme"
-    user_data_dir.mkdir(parents=True, exist_ok=True)
-    target = user_data_dir / filename
-
-    if not target.exists():
-        try:
-            print(f"📥 Downloading {filename} from {url}...")
-            r = requests.get(url)
-            r.raise_for_status()
-            with open(target, "wb") as f:
-                f.write(r.content)
-        except Exception as e:
-            print(f"❌ Failed to download {filename}: {e}")
-
-_perfumes_url = "https://raw.githubusercontent.com/mlacrx/PERFUMEme/main/data/perfumes.json"
-_molecules_url = "https://raw.githubusercontent.com/mlacrx/PERFUMEme/main/data/molecules.json"
-
-_download_if_missing("perfumes.json", _perfumes_url)
-_download_if_missing("molecules.json", _molecules_url)
@@ -0,0 +1,216 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from perfumeme.context import as_context
+from perfumeme.main_functions import has_a_smell, is_toxic_skin, SKIN_TOXICITY_HEADINGS, EVAPORATION_HEADINGS
+from perfumeme.evaporation import evaporation_profile
+from perfumeme.render import render_evaporation
+from perfumeme.usable_function import _assess
+from perfumeme.utils import resolve_input_to_smiles_and_cid, get_pubchem_record_sections
+from perfumeme.singleflight import AsyncSingleFlight
+from perfumeme import session
+
+
+_DEFAULT_CONCURRENCY = 32
+
+_concurrency = _DEFAULT_CONCURRENCY
+_executor = None
+_semaphores = {}
+_lock = threading.Lock()
+_flight = AsyncSingleFlight()
+
+
+def configure_async(concurrency=None):
+    """
+    Configures the number of PubChem lookups the async functions keep in flight at once.
+
+    The blocking I/O of the sync layer (shared session, cache, local index) runs in a dedicated
+    thread pool of this size, and a per-event-loop semaphore keeps at most `concurrency`
+    lookups running; the other coroutines wait without holding a thread. The connection pool of
+    the shared session is enlarged to `concurrency` if it is smaller (see `configure_session`),
+    so that every lookup in flight can keep its connection alive.
+
+    Args:
+        concurrency (int, optional): Maximum number of concurrent lookups. Defaults to 32.
+
+    Returns:
+        int: The concurrency limit now in use.
+    """
+
+    global _concurrency, _executor
+
+    with _lock:
+        if concurrency is not None and concurrency != _concurrency:
+            if concurrency < 1:
+                raise ValueError("The concurrency limit must be at least 1.")
+            _concurrency = concurrency
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+                _executor = None
+            _semaphores.clear()
+        return _concurrency
+
+
+def _get_executor():
+    global _executor
+
+    with _lock:
+        if session.get_settings()["pool_size"] < _concurrency:
+            session.configure_session(pool_size=_concurrency)
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_concurrency, thread_name_prefix="perfumeme")
+        return _executor
+
+
+def _get_semaphore():
+    loop = asyncio.get_running_loop()
+    with _lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            for stale in [l for l in _semaphores if l.is_closed()]:
+                del _semaphores[stale]
+            semaphore = _semaphores[loop] = asyncio.Semaphore(_concurrency)
+        return semaphore
+
+
+async def _run_blocking(func, *args):
+    """
+    Runs a blocking call in the perfumeme thread pool, within the concurrency limit.
+    """
+
+    async with _get_semaphore():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), func, *args)
+
+
+def _load_context(context, headings):
+    context.get_sections(headings)
+    return context
+
+
+async def async_compound_context(compound_name_or_smiles, headings=None):
+    """
+    Builds a `CompoundContext` and downloads its PubChem record without blocking the event loop.
+
+    Concurrent calls for the same name or SMILES on one loop share a single context, so the
+    compound is resolved and downloaded once.
+
+    Args:
+        compound_name_or_smiles (str or CompoundContext): The compound name or SMILES string.
+        headings (tuple[str], optional): Only download these PUG-View headings (see
+            `CompoundContext.get_sections`). Defaults to the full record.
+
+    Returns:
+        CompoundContext: A context whose CID and requested sections are already loaded.
+    """
+
+    context = as_context(compound_name_or_smiles)
+    if context is compound_name_or_smiles:
+        return await _run_blocking(_load_context, context, headings)
+    key = ("context", context.query, headings)
+    return await _flight.do(key, lambda: _run_blocking(_load_context, context, headings))
+
+
+async def async_resolve_input_to_smiles_and_cid(input_str):
+    """
+    Async variant of `resolve_input_to_smiles_and_cid`. Concurrent calls for the same input share one lookup.
+    """
+
+    return await _flight.do(("resolve", input_str), lambda: _run_blocking(resolve_input_to_smiles_and_cid, input_str))
+
+
+async def async_get_pubchem_record_sections(cid):
+    """
+    Async variant of `get_pubchem_record_sections`. Concurrent calls for the same CID share one download.
+    """
+
+    return await _flight.do(("record", cid), lambda: _run_blocking(get_pubchem_record_sections, cid))
+
+
+async def async_has_a_smell(compound_name_or_smiles):
+    """
+    Async variant of `has_a_smell`.
+
+    Args:
+        compound_name_or_smiles (str or CompoundContext): The compound name or SMILES string.
+
+    Returns:
+        bool: True if the compound has a detectable smell, False otherwise.
+    """
+
+    context = await async_compound_context(compound_name_or_smiles)
+    return await _run_blocking(has_a_smell, context)
+
+
+async def async_is_toxic_skin(compound_name_or_smiles):
+    """
+    Async variant of `is_toxic_skin`.
+
+    Args:
+        compound_name_or_smiles (str or CompoundContext): The compound name or SMILES string.
+
+    Returns:
+        bool: True if the compound has documented skin or dermal toxicity information, False otherwise.
+    """
+
+    context = await async_compound_context(compound_name_or_smiles, SKIN_TOXICITY_HEADINGS)
+    return await _run_blocking(is_toxic_skin, context)
+
+
+def _evaporation_trace(context, format):
+    profile = evaporation_profile(context)
+    if profile.model is None:
+        print("⚠️ Not enough data to calculate evaporation curve.")
+        return None, None, None, None, None
+    image = render_evaporation(profile, format=format)
+    return profile.vapor_pressure, profile.boiling_point, profile.vapor_pressure_temp, profile.enthalpy_vap, image
+
+
+def _usable_in_perfume(context, plot):
+    msg, evaporation, note_display = _assess(context)
+    if not plot:
+        return msg
+    image = render_evaporation(evaporation, note=note_display) if note_display else None
+    return msg, image
+
+
+async def async_evaporation_trace(compound_name_or_smiles, format="png"):
+    """
+    Async variant of `evaporation_trace`.
+
+    Everything runs in the thread pool. Since pyplot is not thread-safe and must not block the
+    event loop, the curve is rendered with `render_evaporation` and returned as image bytes
+    instead of a matplotlib figure.
+
+    Args:
+        compound_name_or_smiles (str or CompoundContext): The compound name or SMILES string.
+        format (str, optional): Image format of the curve, "png" or "svg". Defaults to "png".
+
+    Returns:
+        tuple: Same as `evaporation_trace`, with the encoded image (bytes) in place of the figure.
+    """
+
+    context = await async_compound_context(compound_name_or_smiles, EVAPORATION_HEADINGS)
+    return await _run_blocking(_evaporation_trace, context, format)
+
+
+async def async_usable_in_perfume(smiles_or_name, plot=False):
+    """
+    Async variant of `usable_in_perfume`.
+
+    The record is downloaded once and the checks run in the thread pool. No window is ever shown:
+    with `plot=True` the annotated evaporation curve is rendered with `render_evaporation` and
+    returned as PNG bytes along with the summary.
+
+    Args:
+        smiles_or_name (str or CompoundContext): The SMILES string or compound name.
+        plot (bool, optional): Whether to also render the annotated evaporation curve. Defaults to False.
+
+    Returns:
+        str or tuple: Same summary as `usable_in_perfume`; with `plot=True`, a tuple of the summary
+            and the PNG bytes (None if the volatility could not be classified).
+    """
+
+    context = await async_compound_context(smiles_or_name)
+    return await _run_blocking(_usable_in_perfume, context, plot)
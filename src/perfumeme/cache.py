@@ -0,0 +1,229 @@
+import os
+import time
+import zlib
+import sqlite3
+import threading
+from pathlib import Path
+
+
+CACHE_MODES = ("on", "off", "refresh")
+
+_env_mode = os.environ.get("PERFUMEME_CACHE", "on").lower()
+
+_DEFAULT_SETTINGS = {
+    "mode": _env_mode if _env_mode in CACHE_MODES else "on",
+    "ttl": 7 * 24 * 3600,
+    "max_bytes": 256 * 1024 * 1024,
+    "directory": Path.home() / ".perfumeme" / "cache",
+}
+
+_settings = dict(_DEFAULT_SETTINGS)
+_local = threading.local()
+_write_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+"""
+
+
+def configure_cache(mode=None, ttl=None, max_bytes=None, directory=None):
+    """
+    Configures the on-disk cache of raw PubChem responses.
+
+    Only the arguments that are given are changed. The initial mode can also be set with the
+    `PERFUMEME_CACHE` environment variable.
+
+    Args:
+        mode (str, optional): "on" to read and write the cache, "off" to bypass it entirely,
+            "refresh" to always download again and overwrite the stored entries.
+        ttl (float, optional): Age in seconds after which an entry is considered stale.
+        max_bytes (int, optional): Total size budget of the compressed entries. The least
+            recently used entries are evicted when it is exceeded. Snapshot files kept next to
+            the database (see `load_odor_table`) are not counted; `clear_cache` removes them.
+        directory (str or Path, optional): Folder holding the cache database.
+            Defaults to ~/.perfumeme/cache.
+
+    Returns:
+        dict: A copy of the settings now in use.
+
+    Raises:
+        ValueError: If `mode` is not one of "on", "off" or "refresh".
+    """
+
+    if mode is not None:
+        mode = mode.lower()
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid cache mode '{mode}'. Please use 'on', 'off' or 'refresh'.")
+        _settings["mode"] = mode
+    if ttl is not None:
+        _settings["ttl"] = ttl
+    if max_bytes is not None:
+        _settings["max_bytes"] = max_bytes
+    if directory is not None and Path(directory) != _settings["directory"]:
+        _settings["directory"] = Path(directory)
+        _close_connection()
+    return dict(_settings)
+
+
+def _close_connection():
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _local.conn = None
+    _local.directory = None
+
+
+def _connection():
+    """
+    Returns the sqlite connection of the current thread, opening the database if needed.
+    """
+
+    directory = _settings["directory"]
+    if getattr(_local, "conn", None) is None or _local.directory != directory:
+        _close_connection()
+        directory.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(directory / "pubchem.sqlite", timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+        _local.directory = directory
+    return _local.conn
+
+
+def _cache_key(endpoint, key):
+    return f"{endpoint}:{key}"
+
+
+def cache_get(endpoint, key, compressed=False):
+    """
+    Returns the cached raw response for `key` on `endpoint`, or None.
+
+    Entries older than the TTL are ignored. A hit refreshes the entry's LRU position.
+
+    Args:
+        endpoint (str): Short name of the PubChem endpoint, e.g. "pug_view".
+        key (str or int): The CID, SMILES or name the response belongs to.
+        compressed (bool, optional): Return the zlib-compressed body as stored, so that it can be
+            decompressed incrementally. Defaults to False.
+
+    Returns:
+        bytes or None: The response body if a fresh entry exists.
+    """
+
+    if _settings["mode"] != "on":
+        return None
+
+    conn = _connection()
+    row = conn.execute(
+        "SELECT created, data FROM responses WHERE key = ?", (_cache_key(endpoint, key),)
+    ).fetchone()
+    if row is None:
+        return None
+
+    created, data = row
+    now = time.time()
+    if now - created > _settings["ttl"]:
+        return None
+
+    with _write_lock, conn:
+        conn.execute(
+            "UPDATE responses SET last_access = ? WHERE key = ?", (now, _cache_key(endpoint, key))
+        )
+    return data if compressed else zlib.decompress(data)
+
+
+def cache_put(endpoint, key, raw, compressed=False):
+    """
+    Stores a raw response compressed on disk and evicts old entries if over budget.
+
+    Args:
+        endpoint (str): Short name of the PubChem endpoint, e.g. "pug_view".
+        key (str or int): The CID, SMILES or name the response belongs to.
+        raw (bytes): The response body as returned by the server.
+        compressed (bool, optional): `raw` is already zlib-compressed. Defaults to False.
+    """
+
+    if _settings["mode"] == "off":
+        return
+
+    data = raw if compressed else zlib.compress(raw, 6)
+    now = time.time()
+    conn = _connection()
+    with _write_lock, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, created, last_access, size, data) VALUES (?, ?, ?, ?, ?)",
+            (_cache_key(endpoint, key), now, now, len(data), data),
+        )
+        _evict(conn)
+
+
+def _evict(conn):
+    """
+    Deletes the least recently used entries until the total size fits in the budget.
+    """
+
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    if total <= _settings["max_bytes"]:
+        return
+
+    rows = conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+    stale = []
+    for key, size in rows:
+        if total <= _settings["max_bytes"]:
+            break
+        stale.append((key,))
+        total -= size
+    conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+
+def cache_enabled():
+    """
+    Returns True if responses are currently written to the cache.
+    """
+
+    return _settings["mode"] != "off"
+
+
+def cache_dir():
+    """
+    Returns the folder holding the cache database and snapshot files.
+    """
+
+    return _settings["directory"]
+
+
+def cache_info():
+    """
+    Summarizes the content of the cache.
+
+    Returns:
+        dict: Number of entries, total compressed bytes, and the current settings.
+    """
+
+    conn = _connection()
+    entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+    info = dict(_settings)
+    info.update({"entries": entries, "bytes": size})
+    return info
+
+
+def clear_cache():
+    """
+    Removes every entry from the cache, and the snapshot files stored next to it.
+    """
+
+    conn = _connection()
+    with _write_lock, conn:
+        conn.execute("DELETE FROM responses")
+    for snapshot in Path(_settings["directory"]).glob("withodors-*.pickle"):
+        try:
+            snapshot.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,168 @@
+from perfumeme.utils import get_pubchem_record_sections, resolve_input_to_smiles_and_cid, resolve_input_to_cid, merge_sections
+from perfumeme.streaming import streaming_enabled, stream_record_sections, iter_record_sections
+from perfumeme.profile import ALL_FIELDS, FIELD_HEADINGS, CompoundProfile, extract_profile
+
+
+class CompoundContext:
+    """
+    Holds what has been fetched from PubChem for one compound, so that several analyses can share it.
+
+    The input is resolved to a SMILES and CID, and the PUG-View record is downloaded, only the first
+    time they are needed. `has_a_smell`, `is_toxic_skin` and `evaporation_trace` all accept a context
+    in place of a name or SMILES string. In streaming mode (see `configure_streaming`), records are
+    parsed incrementally and only their headings and strings are kept.
+
+    Args:
+        compound_name_or_smiles (str): The compound name or SMILES string for the chemical compound.
+
+    Example:
+        >>> ctx = CompoundContext("linalool")
+        >>> has_a_smell(ctx), is_toxic_skin(ctx)   # one resolution, one record download
+    """
+
+    def __init__(self, compound_name_or_smiles):
+        self.query = compound_name_or_smiles
+        self._smiles = None
+        self._cid = None
+        self._sections = None
+        self._fragments = {}
+        self._merged = []
+        self._profile = None
+
+    def __repr__(self):
+        return f"CompoundContext({self.query!r})"
+
+    @property
+    def smiles(self):
+        """str: The SMILES string of the compound."""
+        if self._smiles is None:
+            self._smiles, self._cid = resolve_input_to_smiles_and_cid(self.query)
+        return self._smiles
+
+    @property
+    def cid(self):
+        """int: The PubChem Compound ID of the compound."""
+        if self._cid is None:
+            self._cid = resolve_input_to_cid(self.query)
+        return self._cid
+
+    @property
+    def sections(self):
+        """list: The top-level sections of the compound's full PUG-View record."""
+        if self._sections is None:
+            self._sections = self._fetch(None)
+        return self._sections
+
+    def _fetch(self, heading):
+        if streaming_enabled():
+            # The full record is only needed for the smell check, which reads every string.
+            return stream_record_sections(self.cid, heading, keep_text=heading is None)
+        return get_pubchem_record_sections(self.cid, heading=heading)
+
+    def get_sections(self, headings=None):
+        """
+        Returns the sections of the record needed for the given headings.
+
+        If the full record has already been downloaded, it is returned as is. Otherwise only the
+        missing headings are downloaded with PUG-View's heading filter, and merged with the
+        fragments fetched earlier into one tree.
+
+        Args:
+            headings (list[str], optional): PUG-View TOC headings, e.g. ["Safety and Hazards"].
+                If None, the full record is returned.
+
+        Returns:
+            list: Top-level sections containing at least the requested headings.
+        """
+
+        if headings is None or self._sections is not None:
+            return self.sections
+
+        for heading in headings:
+            if heading not in self._fragments:
+                self._fragments[heading] = self._fetch(heading)
+                merge_sections(self._merged, self._fragments[heading])
+        return self._merged
+
+    def profile(self, fields=ALL_FIELDS):
+        """
+        Returns the `CompoundProfile` of the compound, with at least the given fields extracted.
+
+        Fields are extracted once and kept. When the full record is needed (for the smell verdict)
+        or already held, every field not extracted yet is filled in the same single pass; otherwise
+        only the headings holding the missing fields are downloaded and walked. In streaming mode,
+        records not held yet are parsed only until every field is settled.
+
+        Args:
+            fields (set[str], optional): Fields needed among "smell", "skin", "vapor_pressure",
+                "boiling_point" and "enthalpy". Defaults to all of them.
+
+        Returns:
+            CompoundProfile: The profile of the compound.
+        """
+
+        if self._profile is None:
+            self._profile = CompoundProfile()
+        missing = set(fields) - self._profile.fields
+        if not missing:
+            return self._profile
+
+        if self._sections is not None or any(FIELD_HEADINGS[f] is None for f in missing):
+            fields, sections = ALL_FIELDS - self._profile.fields, self._sections
+            if sections is None:
+                sections = self._stream(None) if streaming_enabled() else self.sections
+        else:
+            fields, headings = missing, []
+            for f in sorted(missing):
+                headings.extend(h for h in FIELD_HEADINGS[f] if h not in headings)
+            if streaming_enabled():
+                sections = self._stream_headings(headings)
+            else:
+                sections = self.get_sections(headings)
+
+        try:
+            extract_profile(sections, fields, self._profile)
+        finally:
+            if hasattr(sections, "close"):
+                sections.close()
+        return self._profile
+
+    def _stream(self, heading):
+        """
+        Yields the sections of a record (or heading) as they are parsed. The sections are kept
+        as the record or fragment only if the caller reads the stream to its end.
+        """
+
+        consumed = []
+        for section in iter_record_sections(self.cid, heading, keep_text=heading is None):
+            consumed.append(section)
+            yield section
+
+        if heading is None:
+            self._sections = consumed
+        elif heading not in self._fragments:
+            self._fragments[heading] = consumed
+            merge_sections(self._merged, consumed)
+
+    def _stream_headings(self, headings):
+        for heading in headings:
+            if heading in self._fragments:
+                yield from self._fragments[heading]
+            else:
+                yield from self._stream(heading)
+
+
+def as_context(compound):
+    """
+    Wraps a compound name or SMILES string in a `CompoundContext`; contexts are returned unchanged.
+
+    Args:
+        compound (str or CompoundContext): The compound to analyse.
+
+    Returns:
+        CompoundContext: A context for the compound.
+    """
+
+    if isinstance(compound, CompoundContext):
+        return compound
+    return CompoundContext(compound)
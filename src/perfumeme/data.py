@@ -0,0 +1,133 @@
+import os
+import threading
+from pathlib import Path
+
+
+DATA_URLS = {
+    "perfumes.json": "https://raw.githubusercontent.com/mlacrx/PERFUMEme/main/data/perfumes.json",
+    "molecules.json": "https://raw.githubusercontent.com/mlacrx/PERFUMEme/main/data/molecules.json",
+}
+
+# Copies shipped inside the wheel (see pyproject.toml), then the repository's data folder.
+_BUNDLED_DIRS = (Path(__file__).resolve().parent / "data", Path(__file__).resolve().parents[2] / "data")
+
+_lock = threading.Lock()
+
+
+def data_dir():
+    """
+    Returns the directory holding the user's data files.
+
+    It is `$PERFUMEME_DATA_DIR` if set, e.g. a directory provisioned in a container image,
+    else ~/.perfumeme.
+    """
+
+    directory = os.environ.get("PERFUMEME_DATA_DIR")
+    return Path(directory).expanduser() if directory else Path.home() / ".perfumeme"
+
+
+def offline():
+    """
+    Returns True if `$PERFUMEME_OFFLINE` is set to a true value ("1", "true", "yes", "on"):
+    data files are then never downloaded and the bundled copies are used.
+    """
+
+    return os.environ.get("PERFUMEME_OFFLINE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def bundled_path(filename):
+    """
+    Returns the path of the copy of a data file shipped with the package, or None.
+    """
+
+    for directory in _BUNDLED_DIRS:
+        path = directory / filename
+        if path.exists():
+            return path
+    return None
+
+
+def data_path(filename):
+    """
+    Returns the path a data file should be read from, without any download.
+
+    The copy in `data_dir()` is preferred; otherwise the bundled copy is used. If neither exists,
+    the (missing) path in `data_dir()` is returned.
+
+    Args:
+        filename (str): e.g. "perfumes.json", "molecules.json" or "withodors.csv".
+
+    Returns:
+        Path: The path to read.
+    """
+
+    path = data_dir() / filename
+    if path.exists():
+        return path
+    return bundled_path(filename) or path
+
+
+def _download(filename, url, timeout):
+    import requests
+
+    target = data_dir() / filename
+    target.parent.mkdir(parents=True, exist_ok=True)
+    print(f"📥 Downloading {filename} from {url}...")
+    r = requests.get(url, timeout=timeout)
+    r.raise_for_status()
+    tmp = target.with_name(f".{filename}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(r.content)
+    os.replace(tmp, target)
+
+
+def ensure_data(filenames=None, timeout=30, force_offline=None):
+    """
+    Makes sure the data files are available in `data_dir()`, downloading the missing ones.
+
+    Nothing is downloaded at import time: call this function (or `prefetch_data`) when the
+    latest data files are wanted. In offline mode, or if a download fails, the bundled copies
+    are used instead.
+
+    Args:
+        filenames (list[str], optional): Files to provision. Defaults to "perfumes.json" and "molecules.json".
+        timeout (float, optional): Timeout in seconds of each download. Defaults to 30.
+        force_offline (bool, optional): Skip downloads. Defaults to `$PERFUMEME_OFFLINE`.
+
+    Returns:
+        dict: The path each file will be read from (see `data_path`).
+    """
+
+    filenames = list(DATA_URLS) if filenames is None else list(filenames)
+    skip = offline() if force_offline is None else force_offline
+
+    with _lock:
+        for filename in filenames:
+            url = DATA_URLS.get(filename)
+            if skip or url is None or (data_dir() / filename).exists():
+                continue
+            try:
+                _download(filename, url, timeout)
+            except Exception as e:
+                print(f"❌ Failed to download {filename}: {e}")
+
+    return {filename: data_path(filename) for filename in filenames}
+
+
+def prefetch_data(filenames=None, timeout=30):
+    """
+    Runs `ensure_data` in a background daemon thread, so startup does not wait for the network.
+
+    Args:
+        filenames (list[str], optional): Files to provision. Defaults to all downloadable files.
+        timeout (float, optional): Timeout in seconds of each download. Defaults to 30.
+
+    Returns:
+        threading.Thread: The started thread; `join()` it to wait for the files.
+    """
+
+    thread = threading.Thread(
+        target=ensure_data, args=(filenames, timeout), name="perfumeme-data", daemon=True
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,392 @@
+import json
+import threading
+from pathlib import Path
+
+from perfumeme.data import data_path
+
+
+NOTE_TYPES = ("TOP", "HEART", "BASE")
+
+
+class _Snapshot:
+    """
+    One loaded version of a JSON data file, with the stat it was loaded at and its inverted indexes.
+    """
+
+    __slots__ = ("path", "mtime_ns", "size", "data", "indexes")
+
+    def __init__(self, path, mtime_ns, size, data, indexes):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.data = data
+        self.indexes = indexes
+
+    def matches(self, path, stat):
+        return self.path == path and self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+def _new_perfume_indexes():
+    return {"name": {}, "molecule": {}, "note": {tier.lower(): {} for tier in NOTE_TYPES}}
+
+
+def _index_perfume(indexes, perfume_id, perfume):
+    indexes["name"].setdefault(perfume.get("name", "").upper(), []).append(perfume_id)
+    for molecule in dict.fromkeys(m.upper() for m in perfume.get("molecules", [])):
+        indexes["molecule"].setdefault(molecule, []).append(perfume_id)
+    for tier, notes in indexes["note"].items():
+        for note in dict.fromkeys(n.upper() for n in (perfume.get("notes", {}).get(tier) or [])):
+            notes.setdefault(note, []).append(perfume_id)
+
+
+def _new_molecule_indexes():
+    return {"name": {}, "odor": {}}
+
+
+def _index_molecule(indexes, molecule_id, molecule):
+    indexes["name"].setdefault(molecule.get("name", "").lower(), molecule_id)
+    for scent in molecule.get("odor", []):
+        indexes["odor"].setdefault(scent.upper(), []).append(molecule_id)
+
+
+_INDEXERS = {
+    "perfumes": (_new_perfume_indexes, _index_perfume),
+    "molecules": (_new_molecule_indexes, _index_molecule),
+}
+
+
+def _build_indexes(kind, data):
+    new, add = _INDEXERS[kind]
+    indexes = new()
+    for item_id, item in enumerate(data):
+        add(indexes, item_id, item)
+    return indexes
+
+
+def _label(perfume):
+    return f"{perfume['name']} by {perfume['brand']}"
+
+
+def _perfumes_of(snapshot, mol):
+    if snapshot is None:
+        return []
+    ids = snapshot.indexes["molecule"].get(mol.upper(), [])
+    if ids == []:
+        return f"No perfumes found containg this molecule."
+    return [_label(snapshot.data[i]) for i in ids]
+
+
+def _odors_of(snapshot, mol):
+    if snapshot is None:
+        return []
+    molecule_id = snapshot.indexes["name"].get(mol.lower())
+    if molecule_id is not None:
+        molecule = snapshot.data[molecule_id]
+        if "odor" not in molecule:
+            return f"No odors found for this molecule."
+        return molecule.get("odor")
+    if not snapshot.data or mol not in snapshot.data[-1].get("name", []):
+        return f"Molecule not found."
+    return None
+
+
+def _notes_of(snapshot, perfume, note_type, verbose=True):
+    if snapshot is None:
+        return []
+    ids = snapshot.indexes["name"].get(perfume.upper(), [])
+    if ids == []:
+        return f"Perfume not found."
+
+    note_type_upper = note_type.upper()
+    if note_type_upper not in NOTE_TYPES:
+        if verbose and ids[0] == 0:
+            print(f"{note_type} notes for {perfume}:")
+        return f"Invalid note type. Please use 'top', 'heart', or 'base'."
+
+    if verbose:
+        print(f"{note_type} notes for {perfume}:")
+    return snapshot.data[ids[0]].get("notes", {}).get(note_type_upper.lower())
+
+
+def _molecules_of(snapshot, odor):
+    if snapshot is None:
+        return []
+    ids = snapshot.indexes["odor"].get(odor.upper(), [])
+    if ids == []:
+        return f"No molecules found that have this odor."
+    return [snapshot.data[i].get("name", []) for i in ids]
+
+
+def _odor_molecule_perfume(perfume_snapshot, molecule_snapshot, mol):
+    perfumes = _perfumes_of(perfume_snapshot, mol)
+    if perfumes == f"No perfumes found containg this molecule.":
+        return perfumes
+    odors = _odors_of(molecule_snapshot, mol)
+    if odors == f"Molecule not found.":
+        return f"No perfumes found containg this molecule."
+    return {"perfumes": perfumes, "odors": odors}
+
+
+class PerfumeDB:
+    """
+    In-memory view of the perfume and molecule databases ('perfumes.json' and 'molecules.json').
+
+    Each file is parsed once and kept, together with inverted indexes: perfumes by molecule, by
+    name and by note of each tier (top, heart, base), and molecules by name and by odor. Queries
+    go through these indexes, so their cost depends on the size of the result, not of the catalog.
+    Entries added with `add_perfume` and `add_molecule` are indexed as they are added.
+
+    Before every query, a cheap `stat` of the file checks its
+    modification time and size; when the file has changed, it is parsed again and the new data
+    replaces the old one in a single assignment, so concurrent queries see either the old or the
+    new version, never a mix. The functions of `perfumeme.perfume_molecule` are wrappers around
+    the process-wide instance returned by `get_default_db`.
+
+    Args:
+        perfumes_path (str or Path, optional): Perfume database. Defaults to `data_path("perfumes.json")`.
+        molecules_path (str or Path, optional): Molecule database. Defaults to `data_path("molecules.json")`.
+
+    Example:
+        >>> db = PerfumeDB()
+        >>> db.match_molecule_to_perfumes("coumarin")
+    """
+
+    def __init__(self, perfumes_path=None, molecules_path=None):
+        self._paths = {"perfumes": perfumes_path, "molecules": molecules_path}
+        self._snapshots = {"perfumes": None, "molecules": None}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"PerfumeDB(perfumes={self._path('perfumes')}, molecules={self._path('molecules')})"
+
+    def _path(self, kind):
+        path = self._paths[kind]
+        return Path(path) if path else data_path(f"{kind}.json")
+
+    def _load(self, kind):
+        """Returns the current snapshot of a file, parsing it again only if it changed. None if missing."""
+        path = self._path(kind)
+        try:
+            stat = path.stat()
+        except OSError:
+            snapshot = self._snapshots[kind]
+            return snapshot if snapshot is not None and snapshot.mtime_ns is None else None  # built by `_add`
+
+        snapshot = self._snapshots[kind]
+        if snapshot is not None and snapshot.matches(path, stat):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshots[kind]
+            if snapshot is None or not snapshot.matches(path, stat):
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                snapshot = _Snapshot(path, stat.st_mtime_ns, stat.st_size, data, _build_indexes(kind, data))
+                self._snapshots[kind] = snapshot
+        return snapshot
+
+    @property
+    def perfumes(self):
+        """list[dict] or None: The perfume entries, or None if the file does not exist."""
+        snapshot = self._load("perfumes")
+        return snapshot.data if snapshot is not None else None
+
+    @property
+    def molecules(self):
+        """list[dict] or None: The molecule entries, or None if the file does not exist."""
+        snapshot = self._load("molecules")
+        return snapshot.data if snapshot is not None else None
+
+    def reload(self):
+        """
+        Forgets the loaded files; they are parsed again on the next query.
+        """
+
+        with self._lock:
+            self._snapshots = {"perfumes": None, "molecules": None}
+
+    def add_perfume(self, perfume, save=False):
+        """
+        Adds a perfume entry and indexes it.
+
+        Args:
+            perfume (dict): Entry with "name", "brand", "molecules" and "notes" keys, as in 'perfumes.json'.
+            save (bool, optional): Also write the updated database to its file. Defaults to False.
+        """
+
+        self._add("perfumes", perfume, save)
+
+    def add_molecule(self, molecule, save=False):
+        """
+        Adds a molecule entry and indexes it.
+
+        Args:
+            molecule (dict): Entry with "name", "smiles" and "odor" keys, as in 'molecules.json'.
+            save (bool, optional): Also write the updated database to its file. Defaults to False.
+        """
+
+        self._add("molecules", molecule, save)
+
+    def _add(self, kind, entry, save):
+        snapshot = self._load(kind)
+        with self._lock:
+            if snapshot is None:
+                path = self._path(kind)
+                snapshot = self._snapshots[kind] = _Snapshot(path, None, None, [], _build_indexes(kind, []))
+            snapshot.data.append(entry)
+            _INDEXERS[kind][1](snapshot.indexes, len(snapshot.data) - 1, entry)
+            if save:
+                path = snapshot.path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(snapshot.data, f, indent=2)
+                tmp.replace(path)
+                stat = path.stat()
+                snapshot.mtime_ns, snapshot.size = stat.st_mtime_ns, stat.st_size
+
+    def match_molecule_to_perfumes(self, mol):
+        """
+        Returns the perfumes containing a molecule (see `perfume_molecule.match_molecule_to_perfumes`).
+        """
+
+        return _perfumes_of(self._load("perfumes"), mol)
+
+    def match_mol_to_odor(self, mol):
+        """
+        Returns the odor descriptors of a molecule (see `perfume_molecule.match_mol_to_odor`).
+        """
+
+        return _odors_of(self._load("molecules"), mol)
+
+    def odor_molecule_perfume(self, mol):
+        """
+        Returns the perfumes and odors of a molecule (see `perfume_molecule.odor_molecule_perfume`).
+
+        Each database is checked and looked up once, instead of once per condition and per key.
+        """
+
+        return _odor_molecule_perfume(self._load("perfumes"), self._load("molecules"), mol)
+
+    def odor_molecule_perfume_many(self, mols):
+        """
+        Returns the perfumes and odors of many molecules, reading each database once.
+
+        Args:
+            mols (iterable[str]): The molecule names.
+
+        Returns:
+            dict: {molecule: result of `odor_molecule_perfume`}, in the order of `mols`.
+        """
+
+        perfumes, molecules = self._load("perfumes"), self._load("molecules")
+        return {mol: _odor_molecule_perfume(perfumes, molecules, mol) for mol in mols}
+
+    def what_notes(self, perfume, note_type):
+        """
+        Returns the top, heart or base notes of a perfume (see `perfume_molecule.what_notes`).
+        """
+
+        return _notes_of(self._load("perfumes"), perfume, note_type)
+
+    def perfumes_with_note(self, note, note_type=None):
+        """
+        Returns the perfumes having a given note, case-insensitively.
+
+        Args:
+            note (str): The note, e.g. "Bergamot".
+            note_type (str, optional): "top", "heart" or "base". Defaults to any tier.
+
+        Returns:
+            list[str]: Perfumes ("<name> by <brand>") in database order; empty if none has the note.
+
+        Raises:
+            ValueError: If `note_type` is not "top", "heart" or "base".
+        """
+
+        snapshot = self._load("perfumes")
+        if snapshot is None:
+            return []
+
+        if note_type is None:
+            tiers = snapshot.indexes["note"].values()
+        elif note_type.upper() in NOTE_TYPES:
+            tiers = [snapshot.indexes["note"][note_type.lower()]]
+        else:
+            raise ValueError("Invalid note type. Please use 'top', 'heart', or 'base'.")
+
+        ids = sorted({i for tier in tiers for i in tier.get(note.upper(), [])})
+        return [_label(snapshot.data[i]) for i in ids]
+
+    def get_mol_from_odor(self, odor):
+        """
+        Returns the molecules having an odor (see `perfume_molecule.get_mol_from_odor`).
+        """
+
+        return _molecules_of(self._load("molecules"), odor)
+
+    def match_molecules_to_perfumes(self, mols):
+        """
+        Batch form of `match_molecule_to_perfumes`, reading the perfume database once.
+
+        Returns:
+            dict: {molecule: result of `match_molecule_to_perfumes`}, in the order of `mols`.
+        """
+
+        snapshot = self._load("perfumes")
+        return {mol: _perfumes_of(snapshot, mol) for mol in mols}
+
+    def get_mols_from_odors(self, odors):
+        """
+        Batch form of `get_mol_from_odor`, reading the molecule database once.
+
+        Returns:
+            dict: {odor: result of `get_mol_from_odor`}, in the order of `odors`.
+        """
+
+        snapshot = self._load("molecules")
+        return {odor: _molecules_of(snapshot, odor) for odor in odors}
+
+    def what_notes_many(self, perfumes, note_type):
+        """
+        Batch form of `what_notes`, reading the perfume database once and printing nothing.
+
+        Returns:
+            dict: {perfume: result of `what_notes`}, in the order of `perfumes`.
+        """
+
+        snapshot = self._load("perfumes")
+        return {perfume: _notes_of(snapshot, perfume, note_type, verbose=False) for perfume in perfumes}
+
+
+_default_db = None
+_default_lock = threading.Lock()
+
+
+def get_default_db():
+    """
+    Returns the process-wide `PerfumeDB` used by the functions of `perfumeme.perfume_molecule`.
+    """
+
+    global _default_db
+
+    if _default_db is None:
+        with _default_lock:
+            if _default_db is None:
+                _default_db = PerfumeDB()
+    return _default_db
+
+
+def set_default_db(db):
+    """
+    Replaces the process-wide `PerfumeDB`, e.g. with one reading other files. Returns the previous instance.
+
+    Args:
+        db (PerfumeDB or None): The new default database; None restores a default one on next use.
+    """
+
+    global _default_db
+
+    with _default_lock:
+        previous, _default_db = _default_db, db
+    return previous
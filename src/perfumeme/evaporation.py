@@ -0,0 +1,208 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from perfumeme.context import as_context
+from perfumeme.profile import EVAPORATION_FIELDS
+
+
+CLAUSIUS_CLAPEYRON = "clausius-clapeyron"
+BOILING_POINT_FALLBACK = "boiling-point"
+
+DEFAULT_TIMES = np.linspace(0, 25, 300)
+R = 8.314
+
+
+@dataclass
+class EvaporationProfile:
+    """
+    Volatility parameters of a compound and its simulated evaporation curve, without any figure.
+
+    Attributes:
+        query (str): The compound name or SMILES string the profile was computed for.
+        vapor_pressure (float or None): Vapor pressure in mmHg.
+        boiling_point (float or None): Boiling point in °C.
+        vapor_pressure_temp (float or None): Temperature at which the vapor pressure was measured, in °C.
+        enthalpy_vap (float or None): Enthalpy of vaporization in J/mol.
+        model (str or None): "clausius-clapeyron", "boiling-point", or None if there is not enough data.
+        time (numpy.ndarray): Time grid in hours.
+        curve (numpy.ndarray or None): Relative concentration at each time, None if `model` is None.
+    """
+
+    query: str
+    vapor_pressure: object
+    boiling_point: object
+    vapor_pressure_temp: object
+    enthalpy_vap: object
+    model: object
+    time: np.ndarray
+    curve: object
+
+    @property
+    def label(self):
+        """str: Legend label of the curve."""
+        if self.model == CLAUSIUS_CLAPEYRON:
+            return "Clausius-Clapeyron Model"
+        if self.model == BOILING_POINT_FALLBACK:
+            return f"Fallback Model - Tb = {self.boiling_point:.1f}°C"
+        return None
+
+
+def _param(profile, name):
+    value = profile.get(name) if isinstance(profile, dict) else getattr(profile, name, None)
+    return np.nan if value is None else float(value)
+
+
+def evaporation_curves(profiles, times=DEFAULT_TIMES):
+    """
+    Simulates the evaporation curves of many compounds at once, in one broadcast pass.
+
+    Each row uses the same model `evaporation_curve` would pick: Clausius-Clapeyron where the enthalpy
+    of vaporization and a vapor pressure with its temperature are known, else the boiling-point
+    fallback, else no curve. The models are applied with masks on whole arrays, without a Python
+    loop over compounds.
+
+    Args:
+        profiles (iterable): One entry per compound, with `vapor_pressure`, `vapor_pressure_temp`,
+            `boiling_point` and `enthalpy_vap` given as attributes (e.g. `CompoundProfile`,
+            `EvaporationProfile`) or dict keys. Missing values may be None.
+        times (numpy.ndarray, optional): Time grid in hours. Defaults to 300 points over 25 hours.
+
+    Returns:
+        tuple:
+            - curves (numpy.ndarray): Array of shape (n_compounds, n_times) of relative concentrations;
+              rows without enough data are filled with NaN.
+            - models (list): Model of each row, "clausius-clapeyron", "boiling-point" or None.
+
+    Example:
+        >>> curves, models = evaporation_curves([profile_a, profile_b], np.linspace(0, 48, 97))
+        >>> longevity = (curves > 0.5).sum(axis=1)
+    """
+
+    times = np.asarray(times, dtype=float)
+    params = np.array(
+        [[_param(p, "vapor_pressure"), _param(p, "vapor_pressure_temp"), _param(p, "boiling_point"), _param(p, "enthalpy_vap")]
+         for p in profiles],
+        dtype=float,
+    ).reshape(-1, 4)
+    vp, vp_temp, bp, enthalpy = params.T
+
+    def known(values):
+        return np.isfinite(values) & (values != 0)
+
+    cc = known(enthalpy) & known(vp) & known(vp_temp)
+    fallback = ~cc & known(bp)
+    curves = np.full((len(params), len(times)), np.nan)
+
+    if cc.any():
+        h = enthalpy[cc, None]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            C = np.log(vp[cc, None]) + h / (R * (vp_temp[cc, None] + 273.15))
+        pressures = np.exp(C - h / (R * np.linspace(298, 318, len(times))))
+        curves[cc] = np.exp(-0.05 * times / pressures)
+
+    if fallback.any():
+        curves[fallback] = np.exp(-0.2 * times / (bp[fallback, None] / 10))
+
+    if len(times):
+        curves /= curves[:, :1]
+    models = np.where(cc, CLAUSIUS_CLAPEYRON, np.where(fallback, BOILING_POINT_FALLBACK, "")).tolist()
+    return curves, [m or None for m in models]
+
+
+def evaporation_curve(vapor_pressure, vapor_pressure_temp, boiling_point, enthalpy_vap, times=DEFAULT_TIMES):
+    """
+    Simulates the evaporation curve of one compound from its volatility parameters.
+
+    The Clausius-Clapeyron model is used when the enthalpy of vaporization and a vapor pressure with its
+    temperature are known; otherwise an exponential decay based on the boiling point. See
+    `evaporation_curves` for many compounds at once.
+
+    Args:
+        vapor_pressure (float or None): Vapor pressure in mmHg.
+        vapor_pressure_temp (float or None): Temperature of the vapor pressure measurement, in °C.
+        boiling_point (float or None): Boiling point in °C.
+        enthalpy_vap (float or None): Enthalpy of vaporization in J/mol.
+        times (numpy.ndarray, optional): Time grid in hours. Defaults to 300 points over 25 hours.
+
+    Returns:
+        tuple: (model, curve), the model name and the relative concentration at each time,
+            or (None, None) if there is not enough data.
+    """
+
+    curves, models = evaporation_curves([{
+        "vapor_pressure": vapor_pressure,
+        "vapor_pressure_temp": vapor_pressure_temp,
+        "boiling_point": boiling_point,
+        "enthalpy_vap": enthalpy_vap,
+    }], times)
+    if models[0] is None:
+        return None, None
+    return models[0], curves[0]
+
+
+def evaporation_profile(compound_name_or_smiles, times=None):
+    """
+    Computes the evaporation profile of a compound from its PubChem data, without plotting anything.
+
+    This is the compute-only part of `evaporation_trace`: it never imports matplotlib, so it suits
+    headless screening of many molecules. Use `plot_evaporation` to draw a profile.
+
+    Args:
+        compound_name_or_smiles (str or CompoundContext): The compound name or SMILES string,
+            or a `CompoundContext` already holding its PubChem record.
+        times (numpy.ndarray, optional): Time grid in hours. Defaults to 300 points over 25 hours.
+
+    Returns:
+        EvaporationProfile: The volatility parameters, the time grid and the curve.
+
+    Raises:
+        Exception: If the compound cannot be resolved or its data cannot be retrieved from PubChem.
+    """
+
+    context = as_context(compound_name_or_smiles)
+    profile = context.profile(EVAPORATION_FIELDS)
+    times = DEFAULT_TIMES if times is None else np.asarray(times, dtype=float)
+    model, curve = evaporation_curve(
+        profile.vapor_pressure, profile.vapor_pressure_temp, profile.boiling_point, profile.enthalpy_vap, times
+    )
+    return EvaporationProfile(
+        query=context.query,
+        vapor_pressure=profile.vapor_pressure,
+        boiling_point=profile.boiling_point,
+        vapor_pressure_temp=profile.vapor_pressure_temp,
+        enthalpy_vap=profile.enthalpy_vap,
+        model=model,
+        time=times,
+        curve=curve,
+    )
+
+
+def plot_evaporation(profile):
+    """
+    Draws an evaporation profile with pyplot, as `evaporation_trace` does.
+
+    matplotlib is only imported when this function is called.
+
+    Args:
+        profile (EvaporationProfile): A profile with a curve (see `evaporation_profile`).
+
+    Returns:
+        matplotlib.figure.Figure or None: The figure, or None if the profile has no curve.
+    """
+
+    if profile.curve is None:
+        return None
+
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+    color = "green" if profile.model == CLAUSIUS_CLAPEYRON else "blue"
+    ax.plot(profile.time, profile.curve, label=profile.label, color=color)
+    ax.set_xlabel("Time (hours)")
+    ax.set_ylabel("Relative Concentration")
+    ax.set_title(f"Evaporation Curve of {profile.query}")
+    ax.grid(False)
+    ax.legend()
+    plt.tight_layout()
+    return fig
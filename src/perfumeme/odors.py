@@ -0,0 +1,158 @@
+import csv
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+
+from perfumeme import cache
+from perfumeme.data import data_path
+
+
+SNAPSHOT_COLUMNS = ("Name", "Pubchem_CID", "CAS", "IUPAC_name", "Odor_notes", "Odor_tags")
+_SNAPSHOT_VERSION = 1
+
+_table = None
+_table_key = None
+_index = None
+_index_table = None
+_lock = threading.Lock()
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_csv(path):
+    columns = {name: [] for name in SNAPSHOT_COLUMNS}
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            for name in SNAPSHOT_COLUMNS:
+                columns[name].append(row.get(name) or None)
+    return columns
+
+
+def _snapshot_path(csv_path):
+    key = hashlib.sha256(str(Path(csv_path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache.cache_dir()) / f"withodors-{key}.pickle"
+
+
+def _load_snapshot(csv_path, stat):
+    if not cache.cache_enabled():
+        return _read_csv(csv_path)
+
+    snapshot_path = _snapshot_path(csv_path)
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        snapshot = None
+
+    if snapshot and snapshot.get("version") == _SNAPSHOT_VERSION:
+        if (snapshot["mtime_ns"], snapshot["size"]) == (stat.st_mtime_ns, stat.st_size):
+            return snapshot["columns"]
+        file_hash = _file_hash(csv_path)
+        if snapshot["sha256"] == file_hash:
+            snapshot["mtime_ns"], snapshot["size"] = stat.st_mtime_ns, stat.st_size
+            _write_snapshot(snapshot_path, snapshot)
+            return snapshot["columns"]
+    else:
+        file_hash = _file_hash(csv_path)
+
+    columns = _read_csv(csv_path)
+    _write_snapshot(snapshot_path, {
+        "version": _SNAPSHOT_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": file_hash,
+        "columns": columns,
+    })
+    return columns
+
+
+def _write_snapshot(snapshot_path, snapshot):
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = snapshot_path.with_name(snapshot_path.name + f".{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(snapshot_path)
+    except OSError:
+        pass  # read-only cache directory: the CSV is parsed again next time
+
+
+def load_odor_table(csv_path=None):
+    """
+    Returns the columns of 'withodors.csv' needed by the odor lookups, loaded once per process.
+
+    The first time the CSV is read, only the needed columns are kept and stored as a pickle snapshot
+    in the cache directory. Later processes load the snapshot instead of parsing the CSV. A snapshot is
+    reused while the CSV's modification time and size are unchanged (or, if they changed, while its
+    SHA-256 hash is); otherwise it is rebuilt. With the cache off (see `configure_cache`) the CSV is
+    parsed and no snapshot is read or written; `clear_cache` deletes the snapshots.
+
+    Args:
+        csv_path (str or Path, optional): The CSV file. Defaults to `data_path("withodors.csv")`.
+
+    Returns:
+        dict: {column: list of values} for the columns of `SNAPSHOT_COLUMNS`. Empty cells are None.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+    """
+
+    global _table, _table_key
+
+    csv_path = Path(csv_path) if csv_path else data_path("withodors.csv")
+    stat = csv_path.stat()
+    key = (str(csv_path), stat.st_mtime_ns, stat.st_size)
+
+    if _table_key != key:
+        with _lock:
+            if _table_key != key:
+                _table = _load_snapshot(csv_path, stat)
+                _table_key = key
+    return _table
+
+
+def odor_index(csv_path=None):
+    """
+    Returns a dictionary from lowercase compound name to its row in the odor table.
+
+    The index is built once per loaded table, so a lookup is a single dictionary access instead
+    of a scan of every name. When a name appears on several rows, the first one is kept.
+
+    Args:
+        csv_path (str or Path, optional): The CSV file. Defaults to `data_path("withodors.csv")`.
+
+    Returns:
+        tuple: (table, index), the table of `load_odor_table` and {lowercase name: row number}.
+    """
+
+    global _index, _index_table
+
+    table = load_odor_table(csv_path)
+    if _index_table is not table:
+        with _lock:
+            if _index_table is not table:
+                index = {}
+                for row, name in enumerate(table["Name"]):
+                    if name is not None:
+                        index.setdefault(name.lower(), row)
+                _index, _index_table = index, table
+    return table, _index
+
+
+def reset_odor_table():
+    """
+    Forgets the table and index loaded in this process; the next lookup loads them again.
+    """
+
+    global _table, _table_key, _index, _index_table
+
+    with _lock:
+        _table, _table_key = None, None
+        _index, _index_table = None, None
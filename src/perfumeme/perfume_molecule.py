@@ -1,6 +1,5 @@
-import json
-from pathlib import Path
-import os
+from perfumeme.database import get_default_db
+
 
 def match_molecule_to_perfumes(mol):
     """
@@ -23,26 +22,7 @@ def match_molecule_to_perfumes(mol):
         'name' (str), 'brand' (str), and 'molecules' (list of str).
         The molecule matching is performed in uppercase for consistency.
     """
-   
-    path_perf = Path.home() / ".perfumeme" / "perfumes.json"
-
-    if not path_perf.exists():
-        return []
-
-    with open(path_perf, "r", encoding="utf-8") as f:
-        perfumes = json.load(f)
-
-    
-    mol_upper = mol.upper()
-    matched_perfumes = []
-    for perfume in perfumes:
-        if mol_upper in perfume.get("molecules", []):
-            matched_perfumes.append(f"{perfume['name']} by {perfume['brand']}")
-
-    if matched_perfumes == []:
-        return f"No perfumes found containg this molecule."
-    else:
-        return matched_perfumes
+    return get_default_db().match_molecule_to_perfumes(mol)
 
 
 def match_mol_to_odor(mol):
@@ -65,33 +45,15 @@ def match_mol_to_odor(mol):
         'name' (str) and 'odors' (list of str).
         The molecule name comparison is performed in lowercase for consistency.
     """
+    return get_default_db().match_mol_to_odor(mol)
 
-    path = Path.home() / ".perfumeme" / "molecules.json"
-
-    if not path.exists():
-        return []
-
-    with open(path, "r", encoding="utf-8") as f:
-        molecules = json.load(f)
-   
-    mol_lower = mol.lower()
-    
-    for molecule in molecules:
-        if mol_lower == molecule.get("name", []).lower():
-            if "odor" not in molecule:
-                return f"No odors found for this molecule."
-            else:
-                return molecule.get("odor")  
-    if mol not in molecule.get("name", []):
-        return f"Molecule not found."
-              
 
 def odor_molecule_perfume(mol):
     """
     Retrieves perfumes that contain a given molecule along with the associated odor descriptors.
 
     This function combines the outputs of `match_molecule_to_perfumes` and `match_mol_to_odor` 
-    to return a dictionary with two keys:
+    (computed once each, from the in-memory indexes) to return a dictionary with two keys:
     - "perfumes": a list of perfume names and brands containing the molecule.
     - "odors": a list of odor descriptors linked to the molecule.
 
@@ -109,15 +71,27 @@ def odor_molecule_perfume(mol):
         and 'data/molecules.json'. It assumes the functions `match_molecule_to_perfumes` 
         and `match_mol_to_odor` are defined and return expected values.
     """
+    return get_default_db().odor_molecule_perfume(mol)
+
+
+def odor_molecule_perfume_many(mols):
+    """
+    Retrieves the perfumes and odor descriptors of many molecules at once.
+
+    The perfume and molecule databases are read once for the whole batch, and each molecule is
+    resolved with one lookup in each of their indexes.
+
+    Args:
+        mols (list[str]): The names of the molecules to search for.
+
+    Returns:
+        dict: {molecule: result}, where each result is what `odor_molecule_perfume` returns for
+        that molecule (a dict with "perfumes" and "odors", or a message string).
+    """
+
+    return get_default_db().odor_molecule_perfume_many(mols)
+
 
-    dict_mol = {}
-    if match_molecule_to_perfumes(mol) == f"No perfumes found containg this molecule." or match_mol_to_odor(mol) == f"Molecule not found.":
-        return f"No perfumes found containg this molecule."
-    else:
-        dict_mol["perfumes"]= match_molecule_to_perfumes(mol)
-        dict_mol["odors"]= match_mol_to_odor(mol)
-        return dict_mol
-    
 def what_notes(perfume: str, note_type: str):
     """
     Retrieves the notes of a specified perfume from a JSON database.
@@ -137,37 +111,9 @@ def what_notes(perfume: str, note_type: str):
     Notes:
         The note matching is performed in uppercase for consistency.
     """
-    
-    path_perf = Path.home() / ".perfumeme" / "perfumes.json"
-
-    if not path_perf.exists():
-        return []
-
-    with open(path_perf, "r", encoding="utf-8") as f:
-        perfumes = json.load(f)
-    
-        
-    perfume_upper = perfume.upper()
-    note_type_upper = note_type.upper()
-    perf_list = []
-    for perf in perfumes:
-        if perfume_upper == perf.get("name", []).upper():
-            perf_list.append(perf.get("name", []))
-    if perf_list == []:
-        return f"Perfume not found."
-
-    for perf in perfumes:
-        if perfume_upper == perf.get("name", []).upper():
-            print(f"{note_type} notes for {perfume}:")
-            if note_type_upper == "TOP":
-                return perf.get("notes", {}).get("top")
-            elif note_type_upper == "HEART":
-                return perf.get("notes", {}).get("heart")
-            elif note_type_upper == "BASE":
-                return perf.get("notes", {}).get("base")
-        if note_type_upper not in ["TOP", "HEART", "BASE"]:
-                return f"Invalid note type. Please use 'top', 'heart', or 'base'."
-        
+    return get_default_db().what_notes(perfume, note_type)
+
+
 def get_mol_from_odor(odor: str):
     """
     Retrieve a list of molecule names associated with a given odor from a local JSON database.
@@ -187,25 +133,70 @@ def get_mol_from_odor(odor: str):
           with keys such as "name" and "odor".
         - If the JSON file does not exist, the function returns an empty list.
     """
-    
-    path_mol = Path.home() / ".perfumeme" / "molecules.json"
-    
-    if not path_mol.exists():
-        return []
-    with open(path_mol, "r", encoding="utf-8") as f:
-        molecules = json.load(f)
-    
-    odor_upper = odor.upper()
-
-    matched_molecules = []
-
-    for molecule in molecules:
-        for scent in molecule.get("odor", []):
-            if odor_upper == scent.upper():
-                matched_molecules.append(molecule.get("name",[]))
-    
-    if matched_molecules == []:
-        return f"No molecules found that have this odor."
-    else:
-        return matched_molecules        
+    return get_default_db().get_mol_from_odor(odor)
+
+
+def perfumes_with_note(note, note_type=None):
+    """
+    Retrieves the perfumes having a given note, from the inverted note index of the perfume database.
+
+    Args:
+        note (str): The note to search for, e.g. "Bergamot". The search is case-insensitive.
+        note_type (str, optional): Restrict the search to "top", "heart" or "base" notes. Defaults to any tier.
+
+    Returns:
+        list[str]: The perfumes (with brand names) having the note; an empty list if none does.
+
+    Raises:
+        ValueError: If `note_type` is not "top", "heart" or "base".
+    """
+
+    return get_default_db().perfumes_with_note(note, note_type)
+
+
+def match_molecules_to_perfumes(mols):
+    """
+    Retrieves the perfumes containing each of several molecules, reading the perfume database once.
+
+    Args:
+        mols (list[str]): The names of the molecules to search for.
+
+    Returns:
+        dict: {molecule: result}, where each result is what `match_molecule_to_perfumes` returns for
+        that molecule (a list of perfumes, or a message string).
+    """
+
+    return get_default_db().match_molecules_to_perfumes(mols)
+
+
+def get_mols_from_odors(odors):
+    """
+    Retrieves the molecules associated with each of several odors, reading the molecule database once.
+
+    Args:
+        odors (list[str]): The odors to search for (e.g. "woody", "citrus").
+
+    Returns:
+        dict: {odor: result}, where each result is what `get_mol_from_odor` returns for that odor
+        (a list of molecule names, or a message string).
+    """
+
+    return get_default_db().get_mols_from_odors(odors)
+
+
+def what_notes_many(perfumes, note_type):
+    """
+    Retrieves the notes of a given type for several perfumes, reading the perfume database once.
+
+    Unlike `what_notes`, nothing is printed for each perfume.
+
+    Args:
+        perfumes (list[str]): The names of the perfumes.
+        note_type (str): The type of notes to retrieve ("top", "heart", "base").
+
+    Returns:
+        dict: {perfume: result}, where each result is what `what_notes` returns for that perfume
+        (a list of notes, or a message string).
+    """
 
+    return get_default_db().what_notes_many(perfumes, note_type)
@@ -0,0 +1,294 @@
+import re
+from dataclasses import dataclass, field
+
+from perfumeme.traversal import walk_sections, prune_top_level, IRRELEVANT_HEADINGS
+from perfumeme.streaming import TEXT_KEY
+
+
+SMELL = "smell"
+SKIN = "skin"
+VAPOR_PRESSURE = "vapor_pressure"
+BOILING_POINT = "boiling_point"
+ENTHALPY = "enthalpy"
+
+ALL_FIELDS = frozenset({SMELL, SKIN, VAPOR_PRESSURE, BOILING_POINT, ENTHALPY})
+EVAPORATION_FIELDS = frozenset({VAPOR_PRESSURE, BOILING_POINT, ENTHALPY})
+
+SKIN_TOXICITY_HEADINGS = ("Safety and Hazards", "Toxicity")
+EVAPORATION_HEADINGS = ("Chemical and Physical Properties",)
+
+# PUG-View headings holding each field; None means the whole record is searched.
+FIELD_HEADINGS = {
+    SMELL: None,
+    SKIN: SKIN_TOXICITY_HEADINGS,
+    VAPOR_PRESSURE: EVAPORATION_HEADINGS,
+    BOILING_POINT: EVAPORATION_HEADINGS,
+    ENTHALPY: EVAPORATION_HEADINGS,
+}
+
+ODORLESS_KEYWORDS = ["odorless", "odourless", "no smell", "no odour", "without odor"]
+ODOR_KEYWORDS = ["odor", "odour", "fragrance", "aroma", "scent", "smell"]
+
+_VAPOR_PRESSURE_PATTERN = re.compile(
+    r"([\d\.,eE+-]+)\s*(?:\[)?\s*(mmhg|kpa|pa)\s*(?:\])?(?:\s*(?:at)?\s*([\d\.,]+)?\s*°?\s*([cf]))?"
+)
+_ENTHALPY_PATTERN = re.compile(r"([\d\.]+)\s*(kj/mol|j/mol|kcal/mole)")
+
+# Both keyword lists in one alternation, so each string is scanned once. Odorless phrases are
+# plain substrings and are tried first at each position; odor words must be whole words.
+_SMELL_PATTERN = re.compile(
+    "(" + "|".join(map(re.escape, ODORLESS_KEYWORDS)) + r")|\b(?:" + "|".join(map(re.escape, ODOR_KEYWORDS)) + r")\b"
+)
+
+
+@dataclass
+class CompoundProfile:
+    """
+    Everything the analyses read from a compound's PubChem record, extracted in one traversal.
+
+    Attributes:
+        has_smell (bool or None): True if an odor keyword is found first, False if an odorless keyword
+            is found first, None if the record mentions neither.
+        skin_hazard (bool): True if a skin or dermal heading appears under a toxicity, safety or hazards heading.
+        vapor_pressure (float or None): Vapor pressure in mmHg.
+        vapor_pressure_temp (float or None): Temperature at which the vapor pressure was measured, in °C.
+        boiling_point (float or None): Boiling point in °C (values given in °F are preferred, as converted).
+        enthalpy_vap (float or None): Enthalpy of vaporization in J/mol.
+        sources (dict): For each field found, the heading path of the section it came from.
+        fields (set): The fields that have been extracted so far (found or not).
+    """
+
+    has_smell: object = None
+    skin_hazard: bool = False
+    vapor_pressure: object = None
+    vapor_pressure_temp: object = None
+    boiling_point: object = None
+    enthalpy_vap: object = None
+    sources: dict = field(default_factory=dict)
+    fields: set = field(default_factory=set)
+
+
+def smell_verdict(text):
+    """
+    Classifies one string of a record: False if it says the compound is odorless,
+    True if it mentions an odor, None otherwise.
+    """
+
+    verdict = None
+    for match in _SMELL_PATTERN.finditer(text.lower()):
+        if match.group(1):
+            return False
+        verdict = True
+    return verdict
+
+
+def _iter_strings(obj):
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _iter_strings(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _iter_strings(item)
+
+
+def _section_strings(section):
+    for info in section.get("Information", []):
+        for item in info.get("Value", {}).get("StringWithMarkup", []):
+            yield item.get("String", "")
+
+
+def _parse_vapor_pressure(section, state):
+    for raw in _section_strings(section):
+        for val_str, unit, temp_str, temp_unit in _VAPOR_PRESSURE_PATTERN.findall(raw.lower()):
+            try:
+                pressure = float(val_str.replace(",", ""))
+                if pressure >= 100:
+                    continue
+                if unit == "kpa":
+                    pressure *= 7.50062
+                elif unit == "pa":
+                    pressure /= 133.322
+            except ValueError:
+                continue
+            state.vapor_pressure = pressure
+
+            state.vapor_pressure_temp = 25
+            if temp_str and temp_unit:
+                try:
+                    temp = float(temp_str.replace(",", ""))
+                    state.vapor_pressure_temp = temp if temp_unit == "c" else int((temp - 32) * 5 / 9)
+                except ValueError:
+                    pass
+            return True
+    return False
+
+
+def _parse_boiling_point(section, state):
+    found = False
+    for info in section.get("Information", []):
+        strings = info.get("Value", {}).get("StringWithMarkup") or [{}]
+        val = strings[0].get("String", "").lower()
+        try:
+            if "°f" in val:
+                f = float(val.split()[0].replace("°f", "").replace("f", "").strip())
+                state.boiling_point = (f - 32) * 5 / 9
+                found = True
+            elif "°c" in val or "c" in val:
+                state.fallback_celsius = float(val.split()[0].replace("°c", "").replace("c", "").strip())
+                found = True
+        except (ValueError, IndexError):
+            continue
+    return found
+
+
+def _parse_enthalpy(section, state):
+    found = False
+    for raw in _section_strings(section):
+        match_h = _ENTHALPY_PATTERN.search(raw.lower())
+        if match_h:
+            val = float(match_h.group(1))
+            unit = match_h.group(2)
+            if "kj" in unit:
+                state.enthalpy_vap = val * 1000
+            elif "kcal" in unit:
+                state.enthalpy_vap = val * 4184
+            else:
+                state.enthalpy_vap = val
+            found = True
+    return found
+
+
+_PRUNE = prune_top_level()
+_IRRELEVANT = frozenset(IRRELEVANT_HEADINGS)
+_EVAPORATION = frozenset(EVAPORATION_HEADINGS)
+
+
+class _Extraction:
+    """
+    Mutable state of one profile extraction.
+    """
+
+    def __init__(self, fields):
+        self.wanted = set(fields)
+        self.pending = set(fields)
+        self.has_smell = None
+        self.skin_hazard = False
+        self.vapor_pressure = None
+        self.vapor_pressure_temp = None
+        self.boiling_point = None
+        self.fallback_celsius = None
+        self.enthalpy_vap = None
+        self.sources = {}
+
+    def settle(self, name, path):
+        if name in self.pending:
+            self.pending.discard(name)
+            self.sources[name] = " > ".join(path)
+
+    def visit_heading(self, section, path):
+        """Applies the heading-based rules (skin, volatility) to one section. Volatility values are
+        only read under `EVAPORATION_HEADINGS`, the part of the record downloaded for them."""
+        heading = path[-1].lower()
+        parent_heading = path[-2].lower() if len(path) > 1 else ""
+
+        if SKIN in self.pending and any(k in heading for k in ["skin", "dermal"]) \
+                and any(w in parent_heading for w in ["toxicity", "safety", "hazards"]):
+            self.skin_hazard = True
+            self.settle(SKIN, path)
+
+        if path[0] not in _EVAPORATION:
+            return
+
+        # As with the original parser, the first vapor pressure found is kept, while the last boiling
+        # point (°F values first) and the last enthalpy found under the section win.
+        if VAPOR_PRESSURE in self.pending and "vapor pressure" in heading:
+            if _parse_vapor_pressure(section, self):
+                self.settle(VAPOR_PRESSURE, path)
+
+        if BOILING_POINT in self.pending and "boiling point" in heading:
+            if _parse_boiling_point(section, self):
+                self.sources[BOILING_POINT] = " > ".join(path)
+
+        if ENTHALPY in self.pending and any(k in heading for k in ["enthalpy", "heat", "vaporization", "evaporation"]):
+            if _parse_enthalpy(section, self):
+                self.sources[ENTHALPY] = " > ".join(path)
+
+    def leave(self, path):
+        """Settles the last-wins fields once the top-level section holding them has been walked."""
+        if len(path) == 1 and path[0] in _EVAPORATION:
+            self.pending -= {BOILING_POINT, ENTHALPY}
+
+    def scan_strings(self, section, path):
+        """Looks for the first odor or odorless keyword in the strings of a section, subsections aside."""
+        if TEXT_KEY in section:
+            strings = section[TEXT_KEY]  # streamed section: its strings, as listed by the parser
+        else:
+            strings = (text for key, value in section.items() if key != "Section" for text in _iter_strings(value))
+        for text in strings:
+            verdict = smell_verdict(text)
+            if verdict is not None:
+                self.has_smell = verdict
+                self.settle(SMELL, path)
+                return
+
+    def prune(self, section, path):
+        """Skips the top-level sections none of the analyses read, unless the smell verdict is pending."""
+        return SMELL not in self.pending and _PRUNE(section, path)
+
+    def visit(self, section, path):
+        """Applies every pending rule to one section. Irrelevant top-level sections are only read for the smell."""
+        if path[0] not in _IRRELEVANT:
+            self.visit_heading(section, path)
+        if SMELL in self.pending:
+            self.scan_strings(section, path)
+
+    def done(self):
+        return not self.pending
+
+
+def extract_profile(sections, fields=ALL_FIELDS, profile=None):
+    """
+    Extracts a `CompoundProfile` from the sections of a PubChem record in a single traversal.
+
+    The sections are visited once, in record order, by `walk_sections`. Top-level sections none
+    of the analyses read (spectra, literature, patents...) never count for the skin and
+    volatility fields; they are only walked while the smell verdict is pending, since
+    `has_a_smell` searches the whole record, and skipped otherwise. Each requested field is
+    filled by the same rules as `has_a_smell`, `is_toxic_skin` and `evaporation_trace`, and the
+    walk stops as soon as every requested field is settled.
+
+    Args:
+        sections (iterable): Top-level sections of the record, e.g. from `get_pubchem_record_sections`.
+            A generator is consumed only as far as needed.
+        fields (set[str], optional): Fields to extract among "smell", "skin", "vapor_pressure",
+            "boiling_point" and "enthalpy". Defaults to all of them.
+        profile (CompoundProfile, optional): A profile to complete instead of creating a new one.
+
+    Returns:
+        CompoundProfile: The extracted profile.
+    """
+
+    state = _Extraction(fields)
+    for section, path in walk_sections(sections, prune=state.prune, stop=state.done, leave=state.leave):
+        state.visit(section, path)
+
+    if state.boiling_point is None and state.fallback_celsius:
+        state.boiling_point = state.fallback_celsius
+
+    profile = profile if profile is not None else CompoundProfile()
+    if SMELL in state.wanted:
+        profile.has_smell = state.has_smell
+    if SKIN in state.wanted:
+        profile.skin_hazard = state.skin_hazard
+    if VAPOR_PRESSURE in state.wanted:
+        profile.vapor_pressure = state.vapor_pressure
+        profile.vapor_pressure_temp = state.vapor_pressure_temp
+    if BOILING_POINT in state.wanted:
+        profile.boiling_point = state.boiling_point
+    if ENTHALPY in state.wanted:
+        profile.enthalpy_vap = state.enthalpy_vap
+    profile.sources.update(state.sources)
+    profile.fields |= state.wanted
+    return profile
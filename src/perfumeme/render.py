@@ -0,0 +1,125 @@
+import threading
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+
+from perfumeme.evaporation import CLAUSIUS_CLAPEYRON
+
+
+RENDER_FORMATS = ("png", "svg")
+
+_local = threading.local()
+
+
+class _Template:
+    """
+    One evaporation figure drawn with the object-oriented Agg API, reused for every molecule.
+
+    Axes, labels and legend are built once; each render only updates the line data, the colors
+    and the texts, then writes the canvas to bytes. No pyplot state or display is involved.
+    """
+
+    def __init__(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.figure = Figure(figsize=(10, 5))
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+        self.line, = self.ax.plot([], [], label=" ")
+        self.ax.set_xlabel("Time (hours)")
+        self.ax.set_ylabel("Relative Concentration")
+        self.ax.grid(False)
+        self.legend = self.ax.legend()
+        self.note = self.ax.text(
+            0.05, 0.9, "", transform=self.ax.transAxes,
+            fontsize=10, fontweight='bold', color='darkblue',
+            bbox=dict(facecolor='white', alpha=0.6, edgecolor='none'), visible=False
+        )
+        self.title = self.ax.set_title(" ")
+        self.figure.tight_layout()
+
+    def render(self, profile, format, note, dpi):
+        color = "green" if profile.model == CLAUSIUS_CLAPEYRON else "blue"
+        self.line.set_data(profile.time, profile.curve)
+        self.line.set_color(color)
+        self.legend.get_lines()[0].set_color(color)
+        self.legend.get_texts()[0].set_text(profile.label)
+        self.title.set_text(f"Evaporation Curve of {profile.query}")
+        self.note.set_text(note or "")
+        self.note.set_visible(bool(note))
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        buffer = BytesIO()
+        self.figure.savefig(buffer, format=format, dpi=dpi)
+        return buffer.getvalue()
+
+
+def _get_template():
+    template = getattr(_local, "template", None)
+    if template is None:
+        template = _local.template = _Template()
+    return template
+
+
+def render_evaporation(profile, format="png", note=None, dpi=100):
+    """
+    Renders an evaporation profile to image bytes, without pyplot or a display.
+
+    Each thread (and each worker process of `render_many`) keeps one figure template and only
+    updates its line data, so rendering many profiles in a row does not rebuild the axes.
+
+    Args:
+        profile (EvaporationProfile): A profile computed by `evaporation_profile`.
+        format (str, optional): "png" or "svg". Defaults to "png".
+        note (str, optional): Text shown in the top-left corner, e.g. "Note: HEART NOTE".
+        dpi (int, optional): Resolution of PNG images. Defaults to 100.
+
+    Returns:
+        bytes or None: The encoded image, or None if the profile has no curve.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+
+    if format not in RENDER_FORMATS:
+        raise ValueError(f"Unsupported format {format!r}, expected one of {RENDER_FORMATS}.")
+    if profile.curve is None:
+        return None
+    return _get_template().render(profile, format, note, dpi)
+
+
+def _render_task(args):
+    return render_evaporation(*args)
+
+
+def render_many(profiles, format="png", notes=None, dpi=100, max_workers=None, chunksize=16):
+    """
+    Renders many evaporation profiles in parallel worker processes.
+
+    Profiles are sent to a process pool in chunks; each worker renders its chunk with its own
+    reused figure template (see `render_evaporation`).
+
+    Args:
+        profiles (list[EvaporationProfile]): Profiles to render.
+        format (str, optional): "png" or "svg". Defaults to "png".
+        notes (list[str], optional): One note per profile, or None.
+        dpi (int, optional): Resolution of PNG images. Defaults to 100.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs;
+            with 1, profiles are rendered in the current process.
+        chunksize (int, optional): Profiles sent to a worker at a time. Defaults to 16.
+
+    Returns:
+        list: The encoded images (or None for profiles without a curve), in the order of `profiles`.
+    """
+
+    if format not in RENDER_FORMATS:
+        raise ValueError(f"Unsupported format {format!r}, expected one of {RENDER_FORMATS}.")
+    profiles = list(profiles)
+    notes = list(notes) if notes is not None else [None] * len(profiles)
+    tasks = [(profile, format, note, dpi) for profile, note in zip(profiles, notes)]
+
+    if max_workers == 1 or len(tasks) <= 1:
+        return [_render_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_render_task, tasks, chunksize=chunksize))
@@ -0,0 +1,135 @@
+import json
+import threading
+from pathlib import Path
+
+from perfumeme.data import data_path
+from perfumeme.odors import load_odor_table
+
+_index = None
+_index_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _to_cid(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def build_index(withodors_path=None, molecules_path=None):
+    """
+    Builds the local resolver index from the data files shipped with the project.
+
+    Names, IUPAC names and CAS numbers from 'data/withodors.csv' are mapped to their PubChem CID.
+    Names and SMILES from 'molecules.json' are joined on the name to add canonical SMILES keys,
+    and to remember the SMILES of each CID.
+
+    Args:
+        withodors_path (str or Path, optional): CSV with 'Pubchem_CID', 'CAS', 'Name' and 'IUPAC_name' columns.
+        molecules_path (str or Path, optional): JSON list of {"name", "smiles"} entries.
+
+    Returns:
+        dict: {"names": {lowercase name/IUPAC/CAS: cid}, "smiles": {canonical smiles: cid},
+               "smiles_by_cid": {cid: smiles}}
+    """
+
+    from perfumeme.utils import canonicalize_smiles
+
+    withodors_path = Path(withodors_path) if withodors_path else data_path("withodors.csv")
+    molecules_path = Path(molecules_path) if molecules_path else data_path("molecules.json")
+
+    names = {}
+    if withodors_path.exists():
+        table = load_odor_table(withodors_path)
+        for row_cid, *keys in zip(table["Pubchem_CID"], table["Name"], table["IUPAC_name"], table["CAS"]):
+            cid = _to_cid(row_cid)
+            if cid is None:
+                continue
+            for key in keys:
+                key = (key or "").strip().lower()
+                if key:
+                    names.setdefault(key, cid)
+
+    smiles = {}
+    smiles_by_cid = {}
+    if molecules_path.exists():
+        with open(molecules_path, "r", encoding="utf-8") as f:
+            molecules = json.load(f)
+        for molecule in molecules:
+            cid = names.get(molecule.get("name", "").strip().lower())
+            if cid is None or not molecule.get("smiles"):
+                continue
+            smiles.setdefault(canonicalize_smiles(molecule["smiles"]), cid)
+            smiles_by_cid.setdefault(cid, molecule["smiles"])
+
+    return {"names": names, "smiles": smiles, "smiles_by_cid": smiles_by_cid}
+
+
+def _get_index():
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = build_index()
+    return _index
+
+
+def local_lookup(input_str, kind=None):
+    """
+    Looks up a compound name, IUPAC name, CAS number or SMILES in the local index, without any network request.
+
+    Args:
+        input_str (str): Compound name, CAS number or SMILES.
+        kind (str, optional): "smiles" or "name" if already known (see `classify_input`).
+
+    Returns:
+        tuple or None: (smiles: str or None, cid: int) on a hit, None on a miss. The SMILES is the input itself
+        for SMILES queries, the stored SMILES for names when known, and None otherwise.
+    """
+
+    from perfumeme.utils import classify_input, canonicalize_smiles
+
+    index = _get_index()
+    query = input_str.strip()
+    kind = kind or classify_input(query)
+
+    if kind == "smiles":
+        cid = index["smiles"].get(canonicalize_smiles(query))
+        smiles = query
+    else:
+        cid = index["names"].get(query.lower())
+        smiles = index["smiles_by_cid"].get(cid)
+
+    if cid is None:
+        _stats["misses"] += 1
+        return None
+    _stats["hits"] += 1
+    return smiles, cid
+
+
+def resolver_stats():
+    """
+    Returns the number of local index hits and misses since the last reset.
+
+    Returns:
+        dict: {"hits": int, "misses": int, "entries": int}
+    """
+
+    stats = dict(_stats)
+    stats["entries"] = len(_index["names"]) + len(_index["smiles"]) if _index is not None else 0
+    return stats
+
+
+def reset_resolver():
+    """
+    Drops the local index (it is rebuilt on next use) and resets the hit and miss counters.
+    """
+
+    global _index
+
+    with _index_lock:
+        _index = None
+        _stats["hits"] = 0
+        _stats["misses"] = 0
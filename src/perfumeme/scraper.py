@@ -1,7 +1,6 @@
 import json
 from pathlib import Path
-import pandas as pd
-from .utils import get_smiles, get_odor
+from .utils import get_smiles, get_odors
 
 DATA_PATH = Path("data/molecules.json")
 
@@ -110,26 +109,34 @@ def add_odor_to_molecules():
     """
     Adds odor descriptors to perfume entries that do not yet have them.
 
-    For each perfume without an 'odor' field, the function retrieves the odor string using
-    `get_odor`, splits it into a list, and assigns it to the perfume entry.
+    For each perfume without an 'odor' field, the function retrieves its odor notes and assigns
+    them to the perfume entry. All names are looked up in one batch with `get_odors`.
 
-    Raises:
-        Exception: If an error occurs while retrieving odor data for a perfume.
+    Errors are reported for each perfume and do not stop the run; if the batch lookup itself fails
+    (e.g. 'withodors.csv' is missing), the error is reported for every pending perfume.
 
     Notes:
         Modifies the 'perfumes.json' file in place.
-        Relies on `get_odor` from the .utils module.
+        Relies on `get_odors` from the .utils module.
     """
     data = load_data_odor()
-    for entry in data:
-        if "odor" not in entry:
-            try:
-                odor = get_odor(entry["name"])
-                odor_list = [odor_item.strip() for odor_item in odor.split(";")]
-                entry["odor"] = odor_list
-                print(f"Added odor for {entry['name']}: {odor}")
-            except Exception as e:
-                print(f"Error fetching odor for {entry['name']}: {e}")
+    pending = [entry for entry in data if "odor" not in entry]
+    try:
+        odors, missing = get_odors(entry["name"] for entry in pending)
+    except Exception as e:
+        for entry in pending:
+            print(f"Error fetching odor for {entry['name']}: {e}")
+        save_data_odor(data)
+        return
+    for entry in pending:
+        odor_list = odors.get(entry["name"])
+        if odor_list:
+            entry["odor"] = odor_list
+            print(f"Added odor for {entry['name']}: {';'.join(odor_list)}")
+        elif entry["name"] in missing:
+            print(f"Error fetching odor for {entry['name']}: Odor information not found for '{entry['name']}'.")
+        else:
+            print(f"Error fetching odor for {entry['name']}: no odor notes in the dataset.")
     save_data_odor(data)
 
 
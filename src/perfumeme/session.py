@@ -0,0 +1,238 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from perfumeme.throttle import RateLimiter, RETRY_STATUSES, retry_after, backoff_delay
+
+
+PUBCHEM_BASE_URL = "https://pubchem.ncbi.nlm.nih.gov"
+
+_DEFAULT_SETTINGS = {
+    "pool_size": 10,
+    "keep_alive": True,
+    "gzip": True,
+    "connect_timeout": 5.0,
+    "read_timeout": 30.0,
+    "rate": 5.0,
+    "burst": 5,
+    "max_retries": 4,
+    "backoff": 0.5,
+    "max_backoff": 30.0,
+}
+
+_settings = dict(_DEFAULT_SETTINGS)
+_session = None
+_session_lock = threading.Lock()
+_limiter = RateLimiter(_settings["rate"], _settings["burst"], _settings["max_backoff"])
+
+
+def _build_session():
+    """
+    Builds a `requests.Session` from the current settings.
+
+    The session mounts one pooled HTTP adapter for both http and https so that
+    every PubChem call reuses the same TCP/TLS connections instead of opening
+    a new one per lookup.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_settings["pool_size"],
+        pool_maxsize=_settings["pool_size"],
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers["Accept-Encoding"] = "gzip, deflate" if _settings["gzip"] else "identity"
+    session.headers["Connection"] = "keep-alive" if _settings["keep_alive"] else "close"
+    return session
+
+
+def configure_session(pool_size=None, keep_alive=None, gzip=None, connect_timeout=None, read_timeout=None):
+    """
+    Configures the shared HTTP session used for every PubChem request.
+
+    Only the arguments that are given are changed; the others keep their current value.
+    The existing session is closed and a new one is built lazily on the next request.
+
+    Args:
+        pool_size (int, optional): Maximum number of pooled connections kept per host.
+        keep_alive (bool, optional): Whether connections are kept open between requests.
+        gzip (bool, optional): Whether compressed responses are requested from the server.
+        connect_timeout (float, optional): Seconds to wait for a connection to be established.
+        read_timeout (float, optional): Seconds to wait for the server to send data.
+
+    Returns:
+        dict: A copy of the settings now in use.
+    """
+
+    global _session
+
+    updates = {
+        "pool_size": pool_size,
+        "keep_alive": keep_alive,
+        "gzip": gzip,
+        "connect_timeout": connect_timeout,
+        "read_timeout": read_timeout,
+    }
+    with _session_lock:
+        for key, value in updates.items():
+            if value is not None:
+                _settings[key] = value
+        if _session is not None:
+            _session.close()
+            _session = None
+        return dict(_settings)
+
+
+def configure_throttle(rate=None, burst=None, max_retries=None, backoff=None, max_backoff=None):
+    """
+    Configures the rate limiter and retry policy shared by every PubChem request.
+
+    Only the arguments that are given are changed. The limiter adapts its rate to PubChem's
+    `X-Throttling-Control` header; throttled responses (429/503) are retried after the
+    Retry-After delay, or an exponential backoff with jitter when the server gives none; either
+    delay is capped at `max_backoff`, since it pauses every request of the process.
+
+    Args:
+        rate (float, optional): Maximum requests per second. Defaults to PubChem's limit of 5.
+        burst (int, optional): Number of requests that may be sent back-to-back.
+        max_retries (int, optional): Retries of a throttled request before its response is returned.
+        backoff (float, optional): Base delay in seconds of the exponential backoff.
+        max_backoff (float, optional): Upper bound in seconds of a single backoff or Retry-After delay.
+
+    Returns:
+        dict: A copy of the settings now in use.
+    """
+
+    global _limiter
+
+    updates = {
+        "rate": rate,
+        "burst": burst,
+        "max_retries": max_retries,
+        "backoff": backoff,
+        "max_backoff": max_backoff,
+    }
+    with _session_lock:
+        for key, value in updates.items():
+            if value is not None:
+                _settings[key] = value
+        if rate is not None or burst is not None:
+            _limiter = RateLimiter(_settings["rate"], _settings["burst"], _settings["max_backoff"])
+        else:
+            _limiter.max_pause = float(_settings["max_backoff"])
+        return dict(_settings)
+
+
+def get_limiter():
+    """
+    Returns the `RateLimiter` shared by every PubChem request.
+    """
+
+    return _limiter
+
+
+def reset_session():
+    """
+    Restores the default session and throttle settings and drops the current session.
+    """
+
+    global _session, _limiter
+
+    with _session_lock:
+        _settings.clear()
+        _settings.update(_DEFAULT_SETTINGS)
+        _limiter = RateLimiter(_settings["rate"], _settings["burst"], _settings["max_backoff"])
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_session():
+    """
+    Returns the shared `requests.Session`, creating it on first use.
+
+    Returns:
+        requests.Session: The pooled, keep-alive session used by perfumeme.
+    """
+
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get_settings():
+    """
+    Returns a copy of the session settings currently in use.
+    """
+
+    return dict(_settings)
+
+
+def default_timeout():
+    """
+    Returns the (connect, read) timeout tuple applied to every request.
+    """
+
+    return (_settings["connect_timeout"], _settings["read_timeout"])
+
+
+def http_request(method, url, timeout=None, **kwargs):
+    """
+    Sends an HTTP request through the shared session, within the shared rate limit.
+
+    Throttled responses (429/503) are retried up to `max_retries` times (see `configure_throttle`);
+    if they are still throttled, the last response is returned.
+
+    Args:
+        method (str): HTTP method, e.g. "GET" or "POST".
+        url (str): Absolute URL to request.
+        timeout (float or tuple, optional): Overrides the configured (connect, read) timeouts.
+        **kwargs: Extra arguments forwarded to `requests.Session.request`.
+
+    Returns:
+        requests.Response: The server response.
+
+    Raises:
+        requests.exceptions.RequestException: If the connection fails or times out.
+    """
+
+    if timeout is None:
+        timeout = default_timeout()
+
+    attempt = 0
+    while True:
+        limiter = _limiter
+        limiter.acquire()
+        response = get_session().request(method, url, timeout=timeout, **kwargs)
+        limiter.observe(response.headers)
+
+        if response.status_code not in RETRY_STATUSES or attempt >= _settings["max_retries"]:
+            return response
+
+        delay = retry_after(response)
+        if delay is None:
+            delay = backoff_delay(attempt, _settings["backoff"], _settings["max_backoff"])
+        limiter.pause(min(delay, _settings["max_backoff"]))
+        response.close()
+        attempt += 1
+
+
+def http_get(url, **kwargs):
+    """
+    Sends a GET request through the shared session. See `http_request`.
+    """
+
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    """
+    Sends a POST request through the shared session. See `http_request`.
+    """
+
+    return http_request("POST", url, **kwargs)
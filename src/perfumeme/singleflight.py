@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls made from several threads.
+
+    While a call for a key is running, other threads asking for the same key wait for it and get
+    its result (or its exception) instead of running the function again. Once the call is over,
+    the next request for the key runs normally.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> flight.do(("pug_view", 6549), lambda: download(6549))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """
+        Runs `func()` unless a call for `key` is already in flight, in which case its result is shared.
+
+        Args:
+            key (hashable): Identifies identical calls.
+            func (callable): Function without arguments performing the call.
+
+        Returns:
+            The value returned by `func`.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent identical awaits on the same event loop.
+
+    The asyncio counterpart of `SingleFlight`: the first coroutine asking for a key starts the call
+    as a task of its own, and every caller (the first one included) awaits that task. Cancelling
+    any caller, the first one included, does not cancel the shared call or the other callers.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+
+    async def do(self, key, coro_func):
+        """
+        Awaits `coro_func()` unless a call for `key` is already in flight on this loop.
+
+        Args:
+            key (hashable): Identifies identical calls.
+            coro_func (callable): Function without arguments returning an awaitable.
+
+        Returns:
+            The value the awaitable resolves to.
+        """
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        task = self._tasks.get(flight_key)
+        if task is None:
+            task = self._tasks[flight_key] = loop.create_task(coro_func())
+            task.add_done_callback(lambda done: self._forget(flight_key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, flight_key, task):
+        if self._tasks.get(flight_key) is task:
+            del self._tasks[flight_key]
+        if not task.cancelled():
+            task.exception()  # retrieved by the callers; avoid "never retrieved" warnings if all left
@@ -0,0 +1,242 @@
+import re
+import zlib
+import urllib.parse
+
+from perfumeme import session, cache
+
+
+_SECTION_PREFIX = re.compile(r"^Record(\.Section\.item)+$")
+_STRING_SUFFIX = ".Information.item.Value.StringWithMarkup.item.String"
+_CHUNK_SIZE = 64 * 1024
+
+# Key of the pruned sections listing every string of the section, subsections aside, in record order.
+TEXT_KEY = "Strings"
+
+_settings = {"enabled": False}
+
+
+def streaming_available():
+    """
+    Returns True if the optional `ijson` dependency needed for streaming parses is installed.
+    """
+
+    try:
+        import ijson  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def configure_streaming(enabled=None):
+    """
+    Switches the incremental parse mode of PUG-View records on or off.
+
+    In streaming mode, `CompoundContext` parses records straight from the response (or cache)
+    stream and keeps only the section headings and strings the analyses read, instead of
+    building the whole nested record in memory. It requires the optional `ijson` package
+    (`pip install perfumeme[stream]`).
+
+    Args:
+        enabled (bool, optional): Whether records are parsed incrementally. Defaults to off.
+
+    Returns:
+        bool: Whether streaming mode is now on.
+
+    Raises:
+        ImportError: If streaming is enabled but `ijson` is not installed.
+    """
+
+    if enabled is not None:
+        if enabled and not streaming_available():
+            raise ImportError("Streaming mode requires the 'ijson' package: pip install ijson")
+        _settings["enabled"] = bool(enabled)
+    return _settings["enabled"]
+
+
+def streaming_enabled():
+    """
+    Returns True if records are parsed incrementally (see `configure_streaming`).
+    """
+
+    return _settings["enabled"]
+
+
+class _InflateReader:
+    """
+    File-like reader decompressing a zlib blob chunk by chunk.
+    """
+
+    def __init__(self, data):
+        self._data = memoryview(data)
+        self._pos = 0
+        self._inflater = zlib.decompressobj()
+
+    def read(self, size=-1):
+        if size == 0:
+            return b""
+        size = _CHUNK_SIZE if size is None or size < 0 else size
+        out = b""
+        while not out and self._pos < len(self._data):
+            chunk = self._data[self._pos:self._pos + size]
+            self._pos += len(chunk)
+            out = self._inflater.decompress(chunk)
+        if not out and self._pos >= len(self._data):
+            out = self._inflater.flush()
+        return out
+
+
+class _TeeReader:
+    """
+    File-like reader over a response body that also compresses every chunk read for the cache.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._deflater = zlib.compressobj(6)
+        self._parts = []
+
+    def read(self, size=-1):
+        if size == 0:
+            return b""
+        data = self._raw.read(_CHUNK_SIZE if size is None or size < 0 else size)
+        if data:
+            self._parts.append(self._deflater.compress(data))
+        return data
+
+    def drain(self):
+        """Reads the rest of the body without parsing it, and returns the whole body compressed."""
+        while self.read(_CHUNK_SIZE):
+            pass
+        self._parts.append(self._deflater.flush())
+        return b"".join(self._parts)
+
+
+def iter_pruned_sections(stream, stop_after=None, keep_text=False):
+    """
+    Parses a PUG-View JSON record incrementally and yields its top-level sections one at a time.
+
+    Only what the analyses read is kept: each section's "TOCHeading", its subsections ("Section")
+    and the strings of its "Information" values (`Value.StringWithMarkup[].String`). Everything
+    else (references, markup, tables, URLs...) is skipped while parsing and never stored.
+
+    Args:
+        stream (file-like): Binary stream of the JSON record.
+        stop_after (iterable[str], optional): TOC headings the caller needs. Parsing stops as soon
+            as a section with each of them has been completely read.
+        keep_text (bool, optional): Also list every string of each section (descriptions, names...,
+            subsections aside) under `TEXT_KEY`, in record order, for the smell check. Defaults to False.
+
+    Yields:
+        dict: Pruned top-level sections, shaped like those of `get_pubchem_record_sections`.
+    """
+
+    import ijson
+
+    remaining = set(stop_after) if stop_after else None
+    stack = []
+    current = None  # (prefix, section, info prefix, heading prefix, string prefix) of the innermost section
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if event == "string":
+            if current is not None:
+                if keep_text:
+                    current[1][TEXT_KEY].append(value)
+                if prefix == current[4]:
+                    current[1]["Information"][-1]["Value"]["StringWithMarkup"].append({"String": value})
+                elif prefix == current[3]:
+                    current[1]["TOCHeading"] = value
+
+        elif event == "start_map":
+            if current is not None and prefix == current[2]:
+                current[1].setdefault("Information", []).append({"Value": {"StringWithMarkup": []}})
+            elif _SECTION_PREFIX.match(prefix):
+                section = {"TOCHeading": "", TEXT_KEY: []} if keep_text else {"TOCHeading": ""}
+                if current is not None:
+                    current[1].setdefault("Section", []).append(section)
+                current = (prefix, section, prefix + ".Information.item", prefix + ".TOCHeading", prefix + _STRING_SUFFIX)
+                stack.append(current)
+
+        elif event == "end_map" and current is not None and prefix == current[0]:
+            section = stack.pop()[1]
+            current = stack[-1] if stack else None
+            if current is None:
+                yield section
+            if remaining is not None:
+                remaining.discard(section["TOCHeading"])
+                if not remaining:
+                    if current is not None:
+                        yield stack[0][1]
+                    return
+
+
+def iter_record_sections(cid, heading=None, stop_after=None, keep_text=False):
+    """
+    Streams the pruned top-level sections of a compound's PUG-View record.
+
+    The record is read from the on-disk cache when possible (decompressed incrementally),
+    otherwise from the HTTP response stream through the shared session. A downloaded record is
+    stored in the cache once the generator finishes, including after an early stop requested
+    with `stop_after` or after the caller closes the generator: the rest of the body is then read
+    without being parsed (with the cache off, it is not read at all).
+
+    Args:
+        cid (int): The PubChem Compound ID (CID) of the molecule.
+        heading (str, optional): Only stream this PUG-View heading (see `get_pubchem_record_sections`).
+        stop_after (iterable[str], optional): Stop once sections with all these TOC headings have been read.
+        keep_text (bool, optional): Keep every string of the sections (see `iter_pruned_sections`).
+
+    Yields:
+        dict: Pruned top-level sections (see `iter_pruned_sections`).
+
+    Raises:
+        requests.exceptions.RequestException: If the API request fails.
+    """
+
+    url = f"{session.PUBCHEM_BASE_URL}/rest/pug_view/data/compound/{cid}/JSON"
+    endpoint, key = "pug_view", cid
+    if heading is not None:
+        url += f"?heading={urllib.parse.quote(heading)}"
+        endpoint, key = "pug_view/heading", f"{cid}/{heading}"
+
+    stored = cache.cache_get(endpoint, key, compressed=True)
+    if stored is not None:
+        yield from iter_pruned_sections(_InflateReader(stored), stop_after, keep_text)
+        return
+
+    response = session.http_request("GET", url, stream=True)
+    try:
+        if heading is not None and response.status_code == 404:
+            return
+        response.raise_for_status()
+        response.raw.decode_content = True
+        reader = _TeeReader(response.raw)
+        try:
+            yield from iter_pruned_sections(reader, stop_after, keep_text)
+        except GeneratorExit:
+            # The caller stopped early: keep the whole record for later calls, without parsing the rest.
+            if cache.cache_enabled():
+                cache.cache_put(endpoint, key, reader.drain(), compressed=True)
+            raise
+        if cache.cache_enabled():
+            cache.cache_put(endpoint, key, reader.drain(), compressed=True)
+    finally:
+        response.close()
+
+
+def stream_record_sections(cid, heading=None, keep_text=False):
+    """
+    Returns the pruned top-level sections of a record, parsed incrementally.
+
+    Same result shape as `get_pubchem_record_sections`, with a much lower peak memory on large
+    records since the full nested record is never built.
+
+    Args:
+        cid (int): The PubChem Compound ID (CID) of the molecule.
+        heading (str, optional): Only download this PUG-View heading.
+        keep_text (bool, optional): Keep every string of the sections (see `iter_pruned_sections`).
+
+    Returns:
+        list: Pruned top-level sections.
+    """
+
+    return list(iter_record_sections(cid, heading, keep_text=keep_text))
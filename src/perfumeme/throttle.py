@@ -0,0 +1,115 @@
+import re
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+
+
+RETRY_STATUSES = (429, 503)
+
+_STATUS_FACTORS = {"green": 1.0, "yellow": 0.5, "red": 0.25, "black": 0.1}
+_STATUS_PATTERN = re.compile(r"(request count|request time|service) status:\s*(green|yellow|red|black)", re.IGNORECASE)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every PubChem request.
+
+    Tokens are added at `rate` per second up to `burst`; each request takes one and waits when
+    the bucket is empty. The effective rate adapts to PubChem's `X-Throttling-Control` header:
+    it is lowered as soon as any status turns yellow, red or black, and climbs back slowly
+    towards the configured rate while everything stays green. A throttled response
+    (429/503) halves the rate and pauses every caller until the server's Retry-After delay,
+    at most `max_pause` seconds.
+
+    Args:
+        rate (float): Maximum sustained requests per second. PubChem allows 5.
+        burst (int, optional): Bucket capacity. Defaults to `rate`.
+        max_pause (float, optional): Longest pause in seconds, whatever the server asks. Defaults to 30.
+    """
+
+    def __init__(self, rate=5.0, burst=None, max_pause=30.0):
+        self.max_rate = float(rate)
+        self.max_pause = float(max_pause)
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent.
+        """
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """
+        Stops every caller from sending requests for `seconds` (at most `max_pause`), and halves the rate.
+        """
+
+        seconds = min(seconds, self.max_pause)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self.rate = max(self.max_rate * _STATUS_FACTORS["black"], self.rate / 2)
+
+    def observe(self, headers):
+        """
+        Adapts the rate to the `X-Throttling-Control` header of a PubChem response.
+
+        Args:
+            headers (Mapping): Response headers.
+        """
+
+        statuses = _STATUS_PATTERN.findall(headers.get("X-Throttling-Control", ""))
+        if not statuses:
+            return
+        factor = min(_STATUS_FACTORS[color.lower()] for _, color in statuses)
+        with self._lock:
+            if factor < 1.0:
+                self.rate = min(self.rate, self.max_rate * factor)
+            else:
+                self.rate = min(self.max_rate, self.rate * 1.1)
+
+
+def retry_after(response):
+    """
+    Returns the delay in seconds requested by a response's Retry-After header, or None.
+    """
+
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base, cap):
+    """
+    Exponential backoff with full jitter: a random delay in [0, min(cap, base * 2**attempt)].
+    """
+
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
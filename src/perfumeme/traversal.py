@@ -0,0 +1,106 @@
+IRRELEVANT_HEADINGS = (
+    "Spectral Information",
+    "Literature",
+    "Patents",
+    "Biological Test Results",
+    "Interactions and Pathways",
+    "Taxonomy",
+)
+
+
+def walk_sections(sections, prune=None, stop=None, leave=None):
+    """
+    Walks a tree of PubChem sections depth-first, in record order, with an explicit stack.
+
+    Each section is yielded before its subsections, together with its heading path. Subsections
+    are only pulled once the caller has handled their parent, so the walk can end as soon as the
+    caller has what it needs, and `sections` may be a generator consumed only as far as needed.
+
+    Args:
+        sections (iterable): Top-level sections, e.g. from `get_pubchem_record_sections`.
+        prune (callable, optional): `prune(section, path)` returning True skips the section and
+            everything below it (see `prune_top_level`).
+        stop (callable, optional): Called without arguments before each section; returning True
+            ends the walk.
+        leave (callable, optional): `leave(path)` is called once a section and all its subsections
+            have been walked, before the next section is pulled.
+
+    Yields:
+        tuple: (section, path), where path is the tuple of TOC headings from the top-level section
+            down to this one.
+
+    Example:
+        >>> for section, path in walk_sections(record, prune=prune_top_level()):
+        ...     print(" > ".join(path))
+    """
+
+    stack = [(iter(sections), ())]
+    while stack:
+        if stop is not None and stop():
+            return
+        children, parent_path = stack[-1]
+        section = next(children, None)
+        if section is None:
+            stack.pop()
+            if leave is not None and parent_path:
+                leave(parent_path)
+            continue
+        path = parent_path + (section.get("TOCHeading", ""),)
+        if prune is not None and prune(section, path):
+            continue
+        yield section, path
+        subsections = section.get("Section")
+        if subsections:
+            stack.append((iter(subsections), path))
+        elif leave is not None:
+            leave(path)
+
+
+def find_sections(sections, predicate, prune=None, stop=None):
+    """
+    Yields the sections of a tree matching a predicate, as (section, path) pairs (see `walk_sections`).
+
+    Args:
+        sections (iterable): Top-level sections.
+        predicate (callable): `predicate(section)` returning True for wanted sections, e.g. `heading_contains("boiling point")`.
+        prune (callable, optional): Subtrees to skip.
+        stop (callable, optional): Ends the walk when it returns True.
+
+    Yields:
+        tuple: (section, path) of each matching section.
+    """
+
+    for section, path in walk_sections(sections, prune, stop):
+        if predicate(section):
+            yield section, path
+
+
+def heading_contains(*keywords):
+    """
+    Returns a predicate matching sections whose TOC heading contains any of the keywords (case-insensitive).
+    """
+
+    keywords = tuple(k.lower() for k in keywords)
+
+    def predicate(section):
+        heading = section.get("TOCHeading", "").lower()
+        return any(k in heading for k in keywords)
+
+    return predicate
+
+
+def prune_top_level(headings=IRRELEVANT_HEADINGS):
+    """
+    Returns a `prune` callable skipping the top-level sections with the given TOC headings.
+
+    Args:
+        headings (iterable[str], optional): Top-level headings to skip. Defaults to the sections none of
+            the analyses read (spectra, literature, patents, bioassays, pathways, taxonomy).
+    """
+
+    headings = frozenset(headings)
+
+    def prune(section, path):
+        return len(path) == 1 and path[0] in headings
+
+    return prune
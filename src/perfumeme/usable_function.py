@@ -1,36 +1,29 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
-from perfumeme.main_functions import has_a_smell, is_toxic_skin, evaporation_trace
+from perfumeme.main_functions import has_a_smell, is_toxic_skin
+from perfumeme.evaporation import evaporation_profile, plot_evaporation
+from perfumeme.context import as_context
 
 
-def usable_in_perfume(smiles_or_name: str):
+def _assess(smiles_or_name):
     """
-    Evaluates whether a molecule is suitable for use in perfume formulations.
-
-    This function checks three main criteria: whether the molecule has an odor, whether it is safe for dermal 
-    exposure, and whether its volatility is appropriate for perfumery. It uses vapor pressure data (or boiling 
-    point as a fallback) to determine the note classification (top, heart, or base). A graph of the evaporation 
-    curve is generated and annotated with the note type.
-
-    Args:
-        smiles_or_name (str): The SMILES string or compound name.
+    Runs the checks of `usable_in_perfume` without plotting.
 
     Returns:
-        msg (str): A summary string indicating perfume suitability, note classification, and safety.
-
-    
-    Notes:
-        - Uses `has_a_smell`, `is_toxic_skin`, and `evaporation_trace` from the package.
-        - Evaporation note classification is based on vapor pressure extrapolated to 37°C (body temperature).
-        - If vapor pressure data is missing, boiling point is used to estimate volatility.
-        - The resulting plot is saved and optionally annotated with note classification.
+        tuple: The summary message, the `EvaporationProfile`, and the note to write on the
+            evaporation curve (None if the volatility could not be classified).
     """
-    smell_ok = has_a_smell(smiles_or_name)
-    toxicity_ok = not is_toxic_skin(smiles_or_name)
+    context = as_context(smiles_or_name)
+    smell_ok = has_a_smell(context)
+    toxicity_ok = not is_toxic_skin(context)
 
-    pvap, boiling_point, pvap_temp, enthalpy, fig = evaporation_trace(smiles_or_name)
+    evaporation = evaporation_profile(context)
+    if evaporation.model is None:
+        print("⚠️ Not enough data to calculate evaporation curve.")
+        pvap = boiling_point = pvap_temp = None
+    else:
+        pvap, boiling_point, pvap_temp = evaporation.vapor_pressure, evaporation.boiling_point, evaporation.vapor_pressure_temp
 
+    note_display = None
     if pvap is None and boiling_point is None:
         note_type = "undetermined"
         volatility_comment = "⚠️ Insufficient volatility data to classify the note."
@@ -64,21 +57,55 @@ def usable_in_perfume(smiles_or_name: str):
                 note_type = "base note"
             volatility_comment = f"Estimated from boiling point: **{note_type}**."
 
-        if fig and fig.axes:
-            ax = fig.axes[0]
-            ax.axis()
-            note_display = f"Note: {note_type.upper()}" if smell_ok else "No odor"
-            ax.text(
-                0.05, 0.9, note_display, transform=ax.transAxes,
-                fontsize=10, fontweight='bold', color='darkblue',
-                bbox=dict(facecolor='white', alpha=0.6, edgecolor='none')
-            )
-            plt.show()
-            plt.close(fig)
+        note_display = f"Note: {note_type.upper()}" if smell_ok else "No odor"
 
     msg = "Perfume suitability summary:\n"
     msg += "👃 Smell detected.\n" if smell_ok else "🚫 No smell detected.\n"
     msg += "🧴 Skin-safe.\n" if toxicity_ok else "⚠️ Not confirmed safe for skin contact.\n"
     msg += f"{volatility_comment}"
 
-    return msg
\ No newline at end of file
+    return msg, evaporation, note_display
+
+
+def usable_in_perfume(smiles_or_name, plot=True):
+    """
+    Evaluates whether a molecule is suitable for use in perfume formulations.
+
+    This function checks three main criteria: whether the molecule has an odor, whether it is safe for dermal 
+    exposure, and whether its volatility is appropriate for perfumery. It uses vapor pressure data (or boiling 
+    point as a fallback) to determine the note classification (top, heart, or base). A graph of the evaporation 
+    curve is generated and annotated with the note type.
+
+    Args:
+        smiles_or_name (str or CompoundContext): The SMILES string or compound name, or a `CompoundContext`.
+        plot (bool, optional): Whether to show the annotated evaporation curve. With False, matplotlib is
+            never imported, which suits headless screening. Defaults to True.
+
+    Returns:
+        msg (str): A summary string indicating perfume suitability, note classification, and safety.
+
+    
+    Notes:
+        - Uses `has_a_smell`, `is_toxic_skin`, and `evaporation_profile` from the package. The three checks share
+          one `CompoundContext`, so the compound is resolved and its PubChem record downloaded only once.
+        - Evaporation note classification is based on vapor pressure extrapolated to 37°C (body temperature).
+        - If vapor pressure data is missing, boiling point is used to estimate volatility.
+        - The resulting plot is saved and optionally annotated with note classification.
+    """
+    msg, evaporation, note_display = _assess(smiles_or_name)
+
+    fig = plot_evaporation(evaporation) if plot and note_display else None
+    if fig and fig.axes:
+        import matplotlib.pyplot as plt
+
+        ax = fig.axes[0]
+        ax.axis()
+        ax.text(
+            0.05, 0.9, note_display, transform=ax.transAxes,
+            fontsize=10, fontweight='bold', color='darkblue',
+            bbox=dict(facecolor='white', alpha=0.6, edgecolor='none')
+        )
+        plt.show()
+        plt.close(fig)
+
+    return msg
@@ -4,9 +4,71 @@
 import requests
 import json
 from pathlib import Path
-import pandas as pd
 import os
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from perfumeme import session, cache, resolver
+from perfumeme.data import data_path
+from perfumeme.odors import odor_index
+from perfumeme.singleflight import SingleFlight
+
+
+_flight = SingleFlight()
+
+
+def _fetch(endpoint, key, url, method="GET", **kwargs):
+    """
+    Returns the raw body of a PubChem response, served from the on-disk cache when possible.
+
+    Concurrent identical requests (same endpoint and key) from several threads are coalesced:
+    one request goes out and every waiting thread gets its result.
+
+    Args:
+        endpoint (str): Short name of the endpoint, used with `key` to identify the cache entry.
+        key (str or int): The CID, SMILES or name being looked up.
+        url (str): Full URL of the request.
+        method (str): HTTP method. Defaults to "GET".
+        **kwargs: Extra arguments forwarded to the session request.
+
+    Returns:
+        bytes: The response body.
+
+    Raises:
+        requests.HTTPError: If PubChem answers with an error status. Errors are never cached.
+    """
+
+    raw = cache.cache_get(endpoint, key)
+    if raw is None:
+        raw = _flight.do((endpoint, key), lambda: _download(endpoint, key, url, method, **kwargs))
+    return raw
+
+
+def _download(endpoint, key, url, method, **kwargs):
+    response = session.http_request(method, url, **kwargs)
+    response.raise_for_status()
+    raw = response.content
+    cache.cache_put(endpoint, key, raw)
+    return raw
+
+
+def _get_name_properties(compound_name):
+    """
+    Returns the PubChem property entry (CID and IsomericSMILES) of a compound name, in a single request.
+
+    Raises:
+        Exception: If the request fails or no compound matches the name.
+    """
+
+    url = f"{session.PUBCHEM_BASE_URL}/rest/pug/compound/name/{compound_name}/property/IsomericSMILES/JSON"
+    try:
+        data = json.loads(_fetch("name/smiles", compound_name, url))
+    except requests.HTTPError:
+        raise Exception(f"Failed to get SMILES for {compound_name}")
+
+    try:
+        return data["PropertyTable"]["Properties"][0]
+    except (KeyError, IndexError):
+        raise Exception("SMILES not found in response")
 
 
 def get_smiles(compound_name): 
@@ -27,24 +89,74 @@ def get_smiles(compound_name):
         Exception: If the request fails or the SMILES string is not found in the API response.
     """
 
-    url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/{compound_name}/property/IsomericSMILES/JSON"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"Failed to get SMILES for {compound_name}")
-    
-    data = response.json() 
+    properties = _get_name_properties(compound_name)
     try:
-        smiles = data["PropertyTable"]["Properties"][0]["IsomericSMILES"]
-        return smiles
-    except (KeyError, IndexError): 
+        return properties["IsomericSMILES"]
+    except KeyError:
         raise Exception("SMILES not found in response")
 
 
+def _parse_smiles(text):
+    """
+    Parses a string with RDKit, silencing its warnings. Returns an RDKit molecule or None.
+
+    `BlockLogs` restores the previous log levels on exit, so the process-wide RDKit logging
+    configuration is left as it was.
+    """
+
+    from rdkit import Chem, rdBase
+
+    with rdBase.BlockLogs():
+        return Chem.MolFromSmiles(text)
+
+
+def classify_input(input_str):
+    """
+    Tells whether an input string is a SMILES or a compound name, without any network request.
+
+    The string is considered a SMILES if RDKit can parse it into a molecule. Strings containing
+    whitespace are always treated as names.
+
+    Args:
+        input_str (str): Compound name or SMILES.
+
+    Returns:
+        str: "smiles" or "name".
+    """
+
+    text = input_str.strip()
+    if not text or any(c.isspace() for c in text):
+        return "name"
+    return "smiles" if _parse_smiles(text) is not None else "name"
+
+
+def canonicalize_smiles(smiles):
+    """
+    Returns the RDKit canonical form of a SMILES string, so that equivalent spellings share cache entries.
+
+    Args:
+        smiles (str): A SMILES string.
+
+    Returns:
+        str: The canonical (isomeric) SMILES, or the stripped input if RDKit cannot parse it.
+    """
+
+    mol = _parse_smiles(smiles.strip())
+    if mol is None:
+        return smiles.strip()
+    from rdkit import Chem
+    return Chem.MolToSmiles(mol)
+
+
 def resolve_input_to_smiles_and_cid(input_str):
     """
     Attempts to resolve the input string to a valid SMILES and CID.
-    If the input is a SMILES, it directly gets the CID.
-    If the input is a compound name, it first converts it to SMILES.
+    The local index built from 'data/withodors.csv' and 'molecules.json' is tried first (see
+    `perfumeme.resolver`), so known molecules are resolved without any network request.
+    Otherwise the input is classified locally with RDKit (see `classify_input`), so that names never
+    pay for a failed SMILES request.
+    If the input is a SMILES, it directly gets the CID, querying PubChem with its canonical form.
+    If the input is a compound name, its SMILES and CID are fetched together in one request.
 
     Args:
         input_str (str): Compound name or SMILES.
@@ -56,13 +168,178 @@ def resolve_input_to_smiles_and_cid(input_str):
         Exception: If the input cannot be resolved to a valid compound.
     """
 
+    query = input_str.strip()
+    kind = classify_input(query)
+
+    hit = resolver.local_lookup(query, kind)
+    if hit is not None:
+        smiles, cid = hit
+        if smiles is None:
+            smiles = _get_cid_smiles(cid)
+        return smiles, cid
+
+    return _resolve_remote(query, kind)
+
+
+def _resolve_remote(query, kind):
+    """
+    Resolves a stripped name or SMILES to (smiles, cid) with PubChem, using the endpoint matching `kind`.
+    """
+
+    if kind == "smiles":
+        try:
+            cid = get_cid_from_smiles(canonicalize_smiles(query))
+            return query, cid
+        except requests.HTTPError:
+            pass
+
+    properties = _get_name_properties(query)
+    try:
+        return properties["IsomericSMILES"], properties["CID"]
+    except KeyError:
+        smiles = properties["IsomericSMILES"]
+        return smiles, get_cid_from_smiles(smiles)
+
+
+def resolve_input_to_cid(input_str):
+    """
+    Resolves a compound name or SMILES to its PubChem CID only.
+
+    Same as `resolve_input_to_smiles_and_cid`, but a local index hit never triggers a request
+    for the SMILES, which is useful when only the PubChem record is needed.
+
+    Args:
+        input_str (str): Compound name or SMILES.
+
+    Returns:
+        int: The PubChem Compound ID (CID).
+
+    Raises:
+        Exception: If the input cannot be resolved to a valid compound.
+    """
+
+    query = input_str.strip()
+    kind = classify_input(query)
+
+    hit = resolver.local_lookup(query, kind)
+    if hit is not None:
+        return hit[1]
+    return _resolve_remote(query, kind)[1]
+
+
+def _get_cid_smiles(cid):
+    """
+    Returns the IsomericSMILES of a PubChem CID.
+
+    Raises:
+        Exception: If the request fails or the SMILES is not found in the response.
+    """
+
+    url = f"{session.PUBCHEM_BASE_URL}/rest/pug/compound/cid/{cid}/property/IsomericSMILES/JSON"
     try:
-        cid = get_cid_from_smiles(input_str)
-        return input_str, cid
+        data = json.loads(_fetch("cid/smiles", cid, url))
+        return data["PropertyTable"]["Properties"][0]["IsomericSMILES"]
     except requests.HTTPError:
-        smiles = get_smiles(input_str)
-        cid = get_cid_from_smiles(smiles)
-        return smiles, cid
+        raise Exception(f"Failed to get SMILES for CID {cid}")
+    except (KeyError, IndexError):
+        raise Exception("SMILES not found in response")
+
+
+def _get_cids_smiles(cids, chunk_size):
+    """
+    Returns {cid: IsomericSMILES} for many CIDs, using the cache first and then chunked
+    comma-separated PUG REST property requests for the rest.
+    """
+
+    smiles_by_cid = {}
+    missing = []
+    for cid in cids:
+        raw = cache.cache_get("cid/smiles", cid)
+        if raw is None:
+            missing.append(cid)
+        else:
+            smiles_by_cid[cid] = json.loads(raw)["PropertyTable"]["Properties"][0]["IsomericSMILES"]
+
+    url = f"{session.PUBCHEM_BASE_URL}/rest/pug/compound/cid/property/IsomericSMILES/JSON"
+    for start in range(0, len(missing), chunk_size):
+        chunk = missing[start:start + chunk_size]
+        response = session.http_post(url, data={"cid": ",".join(str(cid) for cid in chunk)})
+        response.raise_for_status()
+        for properties in response.json().get("PropertyTable", {}).get("Properties", []):
+            cid = properties.get("CID")
+            if cid in chunk and "IsomericSMILES" in properties:
+                smiles_by_cid[cid] = properties["IsomericSMILES"]
+                single = {"PropertyTable": {"Properties": [properties]}}
+                cache.cache_put("cid/smiles", cid, json.dumps(single).encode("utf-8"))
+    return smiles_by_cid
+
+
+def resolve_many(inputs, chunk_size=100, max_workers=None):
+    """
+    Resolves many compound names or SMILES to (SMILES, CID) at once.
+
+    The inputs are stripped and deduplicated, then split between local index hits (see
+    `perfumeme.resolver`) and remote misses. The SMILES of local hits that only have a CID are
+    fetched with chunked, comma-separated PUG REST property requests. The remaining misses are
+    resolved concurrently through the shared session, one request per item, since PubChem's name
+    and SMILES inputs take a single identifier per request.
+
+    Args:
+        inputs (iterable[str]): Compound names and/or SMILES strings.
+        chunk_size (int, optional): Maximum number of CIDs per batch request. Defaults to 100.
+        max_workers (int, optional): Number of concurrent remote lookups. Defaults to the session pool size.
+
+    Returns:
+        list[dict]: One entry per input, in input order, with the keys "input", "smiles", "cid" and
+        "error". "error" is None on success, otherwise a message and "smiles"/"cid" are None.
+    """
+
+    inputs = list(inputs)
+    queries = list(dict.fromkeys(item.strip() for item in inputs))
+    results = {}
+    cid_only = {}
+    remote = []
+
+    for query in queries:
+        kind = classify_input(query)
+        hit = resolver.local_lookup(query, kind)
+        if hit is None:
+            remote.append((query, kind))
+        elif hit[0] is None:
+            cid_only[query] = hit[1]
+        else:
+            results[query] = {"smiles": hit[0], "cid": hit[1], "error": None}
+
+    if cid_only:
+        try:
+            smiles_by_cid = _get_cids_smiles(list(dict.fromkeys(cid_only.values())), chunk_size)
+        except requests.RequestException as e:
+            smiles_by_cid = {}
+            batch_error = str(e)
+        else:
+            batch_error = None
+        for query, cid in cid_only.items():
+            if cid in smiles_by_cid:
+                results[query] = {"smiles": smiles_by_cid[cid], "cid": cid, "error": None}
+            else:
+                error = batch_error or f"SMILES not found for CID {cid}"
+                results[query] = {"smiles": None, "cid": None, "error": error}
+
+    def resolve_one(item):
+        query, kind = item
+        try:
+            smiles, cid = _resolve_remote(query, kind)
+            return query, {"smiles": smiles, "cid": cid, "error": None}
+        except Exception as e:
+            return query, {"smiles": None, "cid": None, "error": str(e)}
+
+    if remote:
+        workers = max_workers or session.get_settings()["pool_size"]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for query, result in executor.map(resolve_one, remote):
+                results[query] = result
+
+    return [dict(input=item, **results[item.strip()]) for item in inputs]
 
 
 def get_odor(compound_name):
@@ -70,7 +347,8 @@ def get_odor(compound_name):
     Retrieves the odor description for a given compound name from a CSV dataset.
 
     The function performs a case-insensitive search for the compound name in the 'Name' column 
-    of the loaded DataFrame. If a match is found, it returns the corresponding value in the 'Odor_notes' column.
+    of the dataset. If a match is found, it returns the corresponding value in the 'Odor_notes' column.
+    The CSV is parsed once and kept as a compact snapshot, indexed by lowercase name (see `perfumeme.odors`).
 
     Args:
         compound_name (str): The common name of the compound.
@@ -81,23 +359,66 @@ def get_odor(compound_name):
     Raises:
         Exception: If the compound name is not found in the dataset.
     """
-    project_root = Path(__file__).resolve().parents[2]
-    csv_path = project_root / "data" / "withodors.csv"
+    csv_path = data_path("withodors.csv")
 
     if not csv_path.exists():
         raise FileNotFoundError(
             f"\n❌ File not found: {csv_path}\n"
-            "Make sure the 'data/withodors.csv' file is present in the root directory of the project.\n"
-            "This file is not included in the PyPI distribution."
+            "Make sure a 'withodors.csv' file is present in the data directory ($PERFUMEME_DATA_DIR or ~/.perfumeme)."
         )
 
-    df = pd.read_csv(csv_path)
+    table, index = odor_index(csv_path)
 
-    row = df[df["Name"].str.lower() == compound_name.lower()]
-    if not row.empty:
-        return row.iloc[0]["Odor_notes"]
-    else:
-        raise Exception(f"Odor information not found for '{compound_name}'.")
+    row = index.get(compound_name.lower())
+    if row is not None:
+        return table["Odor_notes"][row]
+    raise Exception(f"Odor information not found for '{compound_name}'.")
+
+
+def get_odors(compound_names):
+    """
+    Retrieves the odor notes of many compounds at once from the CSV dataset.
+
+    Each name is looked up case-insensitively in a name index built once (see `get_odor`),
+    so the cost grows with the number of names only.
+
+    Args:
+        compound_names (iterable[str]): The common names of the compounds.
+
+    Returns:
+        tuple:
+            - odors (dict): {name: list of odor notes} for the names found, with the names as given.
+              The list is empty if the dataset has no notes for the compound.
+            - missing (set): The names that are not in the dataset.
+
+    Raises:
+        FileNotFoundError: If the 'withodors.csv' file cannot be found.
+
+    Example:
+        >>> odors, missing = get_odors(["eugenol", "vanillin", "unobtainium"])
+        >>> missing
+        {'unobtainium'}
+    """
+    csv_path = data_path("withodors.csv")
+
+    if not csv_path.exists():
+        raise FileNotFoundError(
+            f"\n❌ File not found: {csv_path}\n"
+            "Make sure a 'withodors.csv' file is present in the data directory ($PERFUMEME_DATA_DIR or ~/.perfumeme)."
+        )
+
+    table, index = odor_index(csv_path)
+
+    odors = {}
+    missing = set()
+    for name in compound_names:
+        row = index.get(name.lower())
+        if row is None:
+            missing.add(name)
+            continue
+        notes = table["Odor_notes"][row]
+        odors[name] = [note.strip() for note in notes.split(";")] if notes else []
+    return odors, missing
 
 
 def get_cid_from_smiles(smiles):
@@ -118,15 +439,14 @@ def get_cid_from_smiles(smiles):
         Exception: If the request fails or if no CID is found for the SMILES input.
     """
     
-    url = "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/smiles/cids/JSON"
+    url = f"{session.PUBCHEM_BASE_URL}/rest/pug/compound/smiles/cids/JSON"
     data = {"smiles": smiles}
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-    response = requests.post(url, data=data, headers=headers, timeout=10)
-    response.raise_for_status()
+    raw = _fetch("smiles/cids", smiles, url, method="POST", data=data, headers=headers)
 
     try:
-        cid = response.json()["IdentifierList"]["CID"][0]
+        cid = json.loads(raw)["IdentifierList"]["CID"][0]
         return cid
     except (KeyError, IndexError):
         raise Exception("CID not found in PubChem response")
@@ -151,14 +471,12 @@ def get_pubchem_description(cid):
         requests.exceptions.RequestException: If the API request fails.
     """
 
-    url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/{cid}/description/JSON"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
+    url = f"{session.PUBCHEM_BASE_URL}/rest/pug/compound/cid/{cid}/description/JSON"
+    data = json.loads(_fetch("description", cid, url))
     return data.get("InformationList",{}).get("Information",[])
 
 
-def get_pubchem_record_sections(cid):
+def get_pubchem_record_sections(cid, heading=None):
     """
     Retrieves the structured data sections for a compound from PubChem using its CID.
 
@@ -169,17 +487,56 @@ def get_pubchem_record_sections(cid):
 
     Args:
         cid (int): The PubChem Compound ID (CID) of the molecule.
+        heading (str, optional): A PUG-View TOC heading (e.g. "Safety and Hazards"). When given,
+            only that part of the record is downloaded, nested under its parent sections.
 
     Returns:
         list: A list of nested dictionaries representing the top-level sections of the 
-              compound's data record. Returns an empty list if no sections are found.
+              compound's data record. Returns an empty list if no sections are found,
+              or if the record has no such heading.
 
     Raises:
         requests.exceptions.RequestException: If the API request fails.
     """
 
-    url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug_view/data/compound/{cid}/JSON"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
+    url = f"{session.PUBCHEM_BASE_URL}/rest/pug_view/data/compound/{cid}/JSON"
+    if heading is None:
+        data = json.loads(_fetch("pug_view", cid, url))
+    else:
+        url += f"?heading={urllib.parse.quote(heading)}"
+        try:
+            data = json.loads(_fetch("pug_view/heading", f"{cid}/{heading}", url))
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return []
+            raise
     return data.get("Record", {}).get("Section",[])
+
+
+def merge_sections(sections, fragment):
+    """
+    Merges the sections of a heading-filtered record fragment into a list of sections, in place.
+
+    Sections with the same TOCHeading at the same level are merged recursively, so fragments
+    downloaded for several headings build up one tree shaped like the full record.
+
+    Args:
+        sections (list): The sections merged so far. Modified in place.
+        fragment (list): The top-level sections of a new fragment.
+
+    Returns:
+        list: `sections`, for convenience.
+    """
+
+    by_heading = {section.get("TOCHeading"): section for section in sections}
+    for section in fragment:
+        existing = by_heading.get(section.get("TOCHeading"))
+        if existing is None:
+            sections.append(section)
+            by_heading[section.get("TOCHeading")] = section
+            continue
+        if "Information" in section and "Information" not in existing:
+            existing["Information"] = section["Information"]
+        if "Section" in section:
+            merge_sections(existing.setdefault("Section", []), section["Section"])
+    return sections
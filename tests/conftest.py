@@ -1,6 +1,84 @@
 import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import pytest
+
 
 src_path = Path(__file__).resolve().parents[1] / "src"
-sys.path.insert(0, str(src_path))
\ No newline at end of file
+sys.path.insert(0, str(src_path))
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.requests.append({
+            "method": self.command,
+            "path": self.path,
+            "headers": dict(self.headers),
+            "body": body.decode("utf-8"),
+        })
+        route = self.server.routes.get(self.path)
+        if route is None:
+            route = self.server.routes.get(self.path.split("?")[0], (404, {"Fault": "not found"}))
+        if callable(route):
+            route = route(self.path, body.decode("utf-8"))
+        status, payload = route[0], route[1]
+        headers = route[2] if len(route) > 2 else {}
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def pubchem_cache(tmp_path):
+    """
+    Points the PubChem response cache at a temporary folder for the duration of a test.
+    """
+    from perfumeme import cache
+
+    previous = cache.configure_cache()
+    cache.configure_cache(mode="on", directory=tmp_path / "cache")
+    yield cache
+    cache.configure_cache(mode=previous["mode"], ttl=previous["ttl"], max_bytes=previous["max_bytes"],
+                          directory=previous["directory"])
+
+
+@pytest.fixture
+def pubchem_stub(monkeypatch, pubchem_cache):
+    """
+    Runs a local HTTP server standing in for PubChem and points perfumeme at it.
+
+    Tests fill `server.routes` with `path -> (status, json_payload[, headers])`
+    (or a callable returning that tuple) and can inspect `server.requests`.
+    """
+    from perfumeme import session
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.routes = {}
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(session, "PUBCHEM_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    session.reset_session()
+    yield server
+    session.reset_session()
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+
+from perfumeme.async_functions import (
+    configure_async, async_get_pubchem_record_sections, async_has_a_smell, async_evaporation_trace, async_usable_in_perfume,
+)
+import pytest
+
+
+def test_async_concurrency_limit(pubchem_stub):
+    """
+    Check that async lookups run concurrently but never exceed the configured limit
+    """
+    lock = threading.Lock()
+    state = {"running": 0, "max": 0}
+
+    def slow_record(path, body):
+        with lock:
+            state["running"] += 1
+            state["max"] = max(state["max"], state["running"])
+        time.sleep(0.1)
+        with lock:
+            state["running"] -= 1
+        return 200, {"Record": {"Section": [{"TOCHeading": path.split("/")[-2]}]}}
+
+    for cid in range(1, 7):
+        pubchem_stub.routes[f"/rest/pug_view/data/compound/{cid}/JSON"] = slow_record
+
+    async def main():
+        return await asyncio.gather(*(async_get_pubchem_record_sections(cid) for cid in range(1, 7)))
+
+    previous = configure_async()
+    configure_async(concurrency=2)
+    try:
+        results = asyncio.run(main())
+    finally:
+        configure_async(concurrency=previous)
+
+    assert [r[0]["TOCHeading"] for r in results] == [str(cid) for cid in range(1, 7)]
+    assert state["max"] == 2
+
+
+def test_async_has_a_smell(pubchem_stub):
+    """
+    Check that the async variant gives the same verdict as the sync function
+    """
+    pubchem_stub.routes["/rest/pug/compound/smiles/cids/JSON"] = (200, {"IdentifierList": {"CID": [999002]}})
+    pubchem_stub.routes["/rest/pug_view/data/compound/999002/JSON"] = (200, {"Record": {"Section": [
+        {"TOCHeading": "Physical Description", "Information": [{"Value": {"StringWithMarkup": [{"String": "Colorless odorless liquid"}]}}]},
+    ]}})
+
+    assert asyncio.run(async_has_a_smell("CCCCCCCCCCCCCCCC(=O)OC")) is False
+
+
+RECORD = {"Record": {"Section": [
+    {"TOCHeading": "Physical Description", "Information": [{"Value": {"StringWithMarkup": [{"String": "Colorless liquid with a floral odor"}]}}]},
+    {"TOCHeading": "Chemical and Physical Properties", "Section": [
+        {"TOCHeading": "Experimental Properties", "Section": [
+            {"TOCHeading": "Boiling Point", "Information": [{"Value": {"StringWithMarkup": [{"String": "198 °C"}]}}]},
+            {"TOCHeading": "Vapor Pressure", "Information": [{"Value": {"StringWithMarkup": [{"String": "0.16 mmHg at 25 °C"}]}}]},
+        ]},
+    ]},
+]}}
+
+
+def test_async_plots_are_rendered_to_bytes_off_the_loop(pubchem_stub, monkeypatch):
+    """
+    Check that the async variants return image bytes and never show a pyplot window
+    """
+    import matplotlib.pyplot as plt
+
+    pubchem_stub.routes["/rest/pug/compound/smiles/cids/JSON"] = (200, {"IdentifierList": {"CID": [999003]}})
+    pubchem_stub.routes["/rest/pug_view/data/compound/999003/JSON"] = (200, RECORD)
+    monkeypatch.setattr(plt, "show", lambda *args, **kwargs: pytest.fail("plt.show() called"))
+    monkeypatch.setattr(plt, "subplots", lambda *args, **kwargs: pytest.fail("pyplot figure created"))
+
+    vp, bp, vp_temp, enthalpy, image = asyncio.run(async_evaporation_trace("CCCCCCCCCCCCC(=O)OC"))
+    assert (vp, bp) == (0.16, 198.0)
+    assert image.startswith(b"\x89PNG")
+
+    assert "base note" in asyncio.run(async_usable_in_perfume("CCCCCCCCCCCCC(=O)OC"))
+    msg, image = asyncio.run(async_usable_in_perfume("CCCCCCCCCCCCC(=O)OC", plot=True))
+    assert "Smell detected" in msg
+    assert image.startswith(b"\x89PNG")
+
+
+def test_async_concurrency_enlarges_connection_pool(pubchem_stub):
+    """
+    Check that the shared session keeps at least one pooled connection per concurrent lookup
+    """
+    from perfumeme import session
+
+    pubchem_stub.routes["/rest/pug_view/data/compound/1/JSON"] = (200, {"Record": {"Section": []}})
+    previous = configure_async()
+    configure_async(concurrency=48)
+    try:
+        asyncio.run(async_get_pubchem_record_sections(1))
+        assert session.get_settings()["pool_size"] == 48
+    finally:
+        configure_async(concurrency=previous)
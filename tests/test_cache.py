@@ -0,0 +1,56 @@
+from perfumeme.utils import get_pubchem_record_sections
+import pytest
+
+
+def test_cache_roundtrip_and_ttl(pubchem_cache):
+    """
+    Check that a stored response is returned compressed-on-disk and ignored once older than the TTL
+    """
+    pubchem_cache.cache_put("pug_view", 702, b'{"Record": {}}')
+    assert pubchem_cache.cache_get("pug_view", 702) == b'{"Record": {}}'
+    assert pubchem_cache.cache_get("pug_view", 703) is None
+
+    pubchem_cache.configure_cache(ttl=-1)
+    assert pubchem_cache.cache_get("pug_view", 702) is None
+
+
+def test_cache_lru_eviction(pubchem_cache):
+    """
+    Check that the least recently used entries are evicted when the byte budget is exceeded
+    """
+    payload = bytes(range(256)) * 40  # barely compressible
+    pubchem_cache.cache_put("pug_view", 1, payload)
+    pubchem_cache.cache_put("pug_view", 2, payload)
+    pubchem_cache.cache_get("pug_view", 1)
+
+    size = pubchem_cache.cache_info()["bytes"] // 2
+    pubchem_cache.configure_cache(max_bytes=2 * size)
+    pubchem_cache.cache_put("pug_view", 3, payload)
+
+    assert pubchem_cache.cache_get("pug_view", 2) is None
+    assert pubchem_cache.cache_get("pug_view", 1) == payload
+    assert pubchem_cache.cache_get("pug_view", 3) == payload
+
+    with pytest.raises(ValueError):
+        pubchem_cache.configure_cache(mode="sometimes")
+
+
+def test_record_sections_are_cached(pubchem_stub, pubchem_cache):
+    """
+    Check that a record is downloaded once, served from the cache afterwards, and downloaded again in refresh mode
+    """
+    pubchem_stub.routes["/rest/pug_view/data/compound/702/JSON"] = (
+        200, {"Record": {"Section": [{"TOCHeading": "Names and Identifiers"}]}}
+    )
+
+    assert get_pubchem_record_sections(702) == [{"TOCHeading": "Names and Identifiers"}]
+    assert get_pubchem_record_sections(702) == [{"TOCHeading": "Names and Identifiers"}]
+    assert len(pubchem_stub.requests) == 1
+
+    pubchem_cache.configure_cache(mode="refresh")
+    get_pubchem_record_sections(702)
+    assert len(pubchem_stub.requests) == 2
+
+    pubchem_cache.configure_cache(mode="off")
+    get_pubchem_record_sections(702)
+    assert len(pubchem_stub.requests) == 3
@@ -0,0 +1,55 @@
+from perfumeme.context import CompoundContext
+from perfumeme.main_functions import has_a_smell, is_toxic_skin, evaporation_trace
+import pytest
+
+
+def test_context_fetches_record_once(pubchem_stub, pubchem_cache):
+    """
+    Check that the three checks sharing one context resolve the compound and download its record only once
+    """
+    pubchem_cache.configure_cache(mode="off")
+    pubchem_stub.routes["/rest/pug/compound/smiles/cids/JSON"] = (200, {"IdentifierList": {"CID": [999001]}})
+    pubchem_stub.routes["/rest/pug_view/data/compound/999001/JSON"] = (200, {"Record": {"Section": [
+        {"TOCHeading": "Chemical and Physical Properties", "Section": [
+            {"TOCHeading": "Odor", "Information": [{"Value": {"StringWithMarkup": [{"String": "Pleasant fragrant vanilla odor"}]}}]},
+            {"TOCHeading": "Boiling Point", "Information": [{"Value": {"StringWithMarkup": [{"String": "568 °F at 760 mmHg"}]}}]},
+        ]},
+    ]}})
+
+    context = CompoundContext("CCCCCCCCCCCCC(=O)OC1CCCCC1")
+    assert has_a_smell(context) is True
+    assert is_toxic_skin(context) is False
+    vp, bp, vp_temp, enthalpy, fig = evaporation_trace(context)
+    assert abs(bp - 297.78) < 0.01
+
+    assert context.cid == 999001
+    assert len(pubchem_stub.requests) == 2
+
+
+def test_context_fetches_only_needed_headings(pubchem_stub, pubchem_cache):
+    """
+    Check that skin toxicity and evaporation only download their headings, and that fragments are merged
+    """
+    base = "/rest/pug_view/data/compound/999001/JSON"
+    pubchem_stub.routes["/rest/pug/compound/smiles/cids/JSON"] = (200, {"IdentifierList": {"CID": [999001]}})
+    pubchem_stub.routes[base + "?heading=Safety%20and%20Hazards"] = (200, {"Record": {"Section": [
+        {"TOCHeading": "Safety and Hazards", "Section": [
+            {"TOCHeading": "Hazards Identification", "Section": [{"TOCHeading": "Skin Irritation"}]},
+        ]},
+    ]}})
+    pubchem_stub.routes[base + "?heading=Chemical%20and%20Physical%20Properties"] = (200, {"Record": {"Section": [
+        {"TOCHeading": "Chemical and Physical Properties", "Section": [
+            {"TOCHeading": "Boiling Point", "Information": [{"Value": {"StringWithMarkup": [{"String": "200 °C"}]}}]},
+        ]},
+    ]}})
+
+    context = CompoundContext("CCCCCCCCCCCCC(=O)OC1CCCCC1")
+    assert is_toxic_skin(context) is True
+    assert evaporation_trace(context)[1] == 200.0
+
+    paths = [r["path"] for r in pubchem_stub.requests]
+    assert base not in paths
+    assert len(paths) == 4  # CID, "Safety and Hazards", "Toxicity" (absent: 404), "Chemical and Physical Properties"
+    assert [s["TOCHeading"] for s in context.get_sections(["Safety and Hazards"])] == [
+        "Safety and Hazards", "Chemical and Physical Properties"
+    ]
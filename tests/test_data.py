@@ -0,0 +1,31 @@
+from perfumeme import data, session
+
+
+def test_data_path_falls_back_to_bundled(monkeypatch, tmp_path):
+    """
+    Check that PERFUMEME_DATA_DIR is honoured and that bundled files are used when it lacks a file
+    """
+    monkeypatch.setenv("PERFUMEME_DATA_DIR", str(tmp_path))
+    assert data.data_dir() == tmp_path
+    assert data.data_path("perfumes.json") == data.bundled_path("perfumes.json")
+
+    (tmp_path / "perfumes.json").write_text("[]")
+    assert data.data_path("perfumes.json") == tmp_path / "perfumes.json"
+
+
+def test_ensure_data_offline_and_download(monkeypatch, tmp_path, pubchem_stub):
+    """
+    Check that offline mode never downloads, and that ensure_data downloads missing files otherwise
+    """
+    monkeypatch.setenv("PERFUMEME_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(data, "DATA_URLS", {"perfumes.json": f"{session.PUBCHEM_BASE_URL}/data/perfumes.json"})
+    pubchem_stub.routes["/data/perfumes.json"] = (200, [{"name": "Test", "brand": "Stub", "molecules": []}])
+
+    monkeypatch.setenv("PERFUMEME_OFFLINE", "1")
+    assert data.ensure_data() == {"perfumes.json": data.bundled_path("perfumes.json")}
+    assert pubchem_stub.requests == []
+
+    monkeypatch.delenv("PERFUMEME_OFFLINE")
+    data.prefetch_data().join()
+    assert (tmp_path / "perfumes.json").exists()
+    assert len(pubchem_stub.requests) == 1
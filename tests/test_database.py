@@ -0,0 +1,67 @@
+import os
+import json
+
+from perfumeme.database import PerfumeDB, get_default_db, set_default_db
+from perfumeme.perfume_molecule import match_molecule_to_perfumes
+
+
+def _write(path, data, mtime_ns):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_perfumedb_reloads_changed_files(tmp_path, monkeypatch):
+    """
+    Check that a file is parsed once while unchanged, and parsed again after it changes
+    """
+    perfumes = tmp_path / "perfumes.json"
+    _write(perfumes, [{"name": "A", "brand": "X", "molecules": ["COUMARIN"]}], 10**18)
+    db = PerfumeDB(perfumes_path=perfumes, molecules_path=tmp_path / "missing.json")
+
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(json, "load", lambda f: loads.append(f.name) or real_load(f))
+
+    assert db.match_molecule_to_perfumes("coumarin") == ["A by X"]
+    assert db.match_molecule_to_perfumes("Coumarin") == ["A by X"]
+    assert len(loads) == 1
+
+    _write(perfumes, [{"name": "B", "brand": "Y", "molecules": ["COUMARIN"]}], 2 * 10**18)
+    assert db.match_molecule_to_perfumes("coumarin") == ["B by Y"]
+    assert len(loads) == 2
+    assert db.match_mol_to_odor("coumarin") == []
+
+
+def test_functions_use_default_db(tmp_path):
+    """
+    Check that the perfume_molecule functions are served by the process-wide database
+    """
+    perfumes = tmp_path / "perfumes.json"
+    _write(perfumes, [{"name": "C", "brand": "Z", "molecules": ["VANILLIN"]}], 10**18)
+    previous = set_default_db(PerfumeDB(perfumes_path=perfumes))
+    try:
+        assert match_molecule_to_perfumes("vanillin") == ["C by Z"]
+    finally:
+        set_default_db(previous)
+    assert get_default_db() is not None
+
+
+def test_perfumedb_indexes_follow_updates(tmp_path):
+    """
+    Check the note and odor indexes, including entries added after loading
+    """
+    perfumes = tmp_path / "perfumes.json"
+    _write(perfumes, [{"name": "A", "brand": "X", "molecules": ["LINALOOL"], "notes": {"top": ["Bergamot"], "base": ["Musk"]}}], 10**18)
+    db = PerfumeDB(perfumes_path=perfumes, molecules_path=tmp_path / "molecules.json")
+
+    assert db.perfumes_with_note("bergamot") == ["A by X"]
+    assert db.perfumes_with_note("bergamot", "base") == []
+
+    db.add_perfume({"name": "B", "brand": "Y", "molecules": ["LINALOOL"], "notes": {"heart": ["Musk"]}}, save=True)
+    assert db.match_molecule_to_perfumes("linalool") == ["A by X", "B by Y"]
+    assert db.perfumes_with_note("MUSK") == ["A by X", "B by Y"]
+    assert PerfumeDB(perfumes_path=perfumes).what_notes("b", "heart") == ["Musk"]
+
+    db.add_molecule({"name": "linalool", "odor": ["floral", "woody"]})
+    assert db.get_mol_from_odor("Woody") == ["linalool"]
+    assert db.match_mol_to_odor("LINALOOL") == ["floral", "woody"]
@@ -0,0 +1,70 @@
+import sys
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+from perfumeme.context import CompoundContext
+from perfumeme.evaporation import evaporation_curve, evaporation_curves, evaporation_profile, CLAUSIUS_CLAPEYRON, BOILING_POINT_FALLBACK
+
+
+def test_evaporation_curve_models():
+    """
+    Check the model chosen for each kind of data, and that curves start at 1
+    """
+    model, curve = evaporation_curve(0.16, 25, 198.0, 62400.0)
+    assert model == CLAUSIUS_CLAPEYRON
+    assert curve.shape == (300,) and curve[0] == 1.0 and curve[-1] < 1.0
+
+    model, curve = evaporation_curve(None, None, 198.0, None, times=np.linspace(0, 10, 11))
+    assert model == BOILING_POINT_FALLBACK
+    assert np.isclose(curve[-1], np.exp(-0.2 * 10 / 19.8))
+
+    assert evaporation_curve(0.16, 25, None, None) == (None, None)
+
+
+def test_evaporation_profile_is_headless(pubchem_stub):
+    """
+    Check that evaporation_profile computes from the record without importing pyplot
+    """
+    pubchem_stub.routes["/rest/pug/compound/smiles/cids/JSON"] = (200, {"IdentifierList": {"CID": [999001]}})
+    pubchem_stub.routes["/rest/pug_view/data/compound/999001/JSON?heading=Chemical%20and%20Physical%20Properties"] = (
+        200, {"Record": {"Section": [
+            {"TOCHeading": "Chemical and Physical Properties", "Section": [
+                {"TOCHeading": "Boiling Point", "Information": [{"Value": {"StringWithMarkup": [{"String": "200 °C"}]}}]},
+            ]},
+        ]}}
+    )
+    profile = evaporation_profile(CompoundContext("CCCCCCCCCCCCC(=O)OC1CCCCC1"))
+    assert profile.model == BOILING_POINT_FALLBACK
+    assert profile.boiling_point == 200.0
+    assert profile.curve.shape == profile.time.shape
+
+    code = (
+        "import sys; from perfumeme.evaporation import evaporation_curve; "
+        "evaporation_curve(None, None, 200.0, None); print('matplotlib.pyplot' in sys.modules)"
+    )
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env={"PYTHONPATH": src})
+    assert out.stdout.strip() == "False"
+
+
+def test_evaporation_curves_matches_per_molecule_models():
+    """
+    Check that the batch curves reproduce the per-molecule formulas, with NaN rows where data is missing
+    """
+    times = np.linspace(0, 25, 300)
+    profiles = [
+        {"vapor_pressure": 0.16, "vapor_pressure_temp": 25, "boiling_point": 198.0, "enthalpy_vap": 62400.0},
+        {"vapor_pressure": None, "vapor_pressure_temp": None, "boiling_point": 230.0, "enthalpy_vap": None},
+        {"vapor_pressure": 0.5, "vapor_pressure_temp": 25, "boiling_point": None, "enthalpy_vap": None},
+    ]
+    curves, models = evaporation_curves(profiles, times)
+    assert curves.shape == (3, 300)
+    assert models == [CLAUSIUS_CLAPEYRON, BOILING_POINT_FALLBACK, None]
+
+    C = np.log(0.16) + 62400.0 / (8.314 * 298.15)
+    expected = np.exp(-0.05 * times / np.exp(C - 62400.0 / (8.314 * np.linspace(298, 318, 300))))
+    assert np.allclose(curves[0], expected / expected[0])
+    assert np.allclose(curves[1], np.exp(-0.2 * times / 23.0))
+    assert np.isnan(curves[2]).all()
@@ -0,0 +1,48 @@
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+
+
+def _run(code):
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env={"PYTHONPATH": SRC}, check=True)
+    return time.perf_counter() - start, out.stdout.strip()
+
+
+def test_import_is_lazy_and_fast():
+    """
+    Check that `import perfumeme` loads none of the heavy dependencies and stays within an import-time budget
+    """
+    baseline, _ = _run("pass")
+    elapsed, loaded = _run(
+        "import sys, perfumeme; "
+        "print(sorted(m for m in ('matplotlib', 'pandas', 'numpy', 'rdkit', 'requests') if m in sys.modules))"
+    )
+    assert loaded == "[]"
+    assert elapsed - baseline < 0.5
+
+
+def test_public_names_load_on_access():
+    """
+    Check that public names resolve to their submodule objects on first access
+    """
+    _, out = _run(
+        "import sys, perfumeme; from perfumeme import match_molecule_to_perfumes; "
+        "print(match_molecule_to_perfumes.__module__, 'pandas' in sys.modules, 'what_notes' in dir(perfumeme))"
+    )
+    assert out == "perfumeme.perfume_molecule False True"
+
+
+def test_submodules_load_on_attribute_access():
+    """
+    Check that submodules are reachable as attributes of the package, as with the former eager imports
+    """
+    _, out = _run(
+        "import perfumeme; "
+        "print(perfumeme.utils.__name__, perfumeme.scraper.__name__, hasattr(perfumeme, 'no_such_module'))"
+    )
+    assert out == "perfumeme.utils perfumeme.scraper False"
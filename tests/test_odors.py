@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from perfumeme import odors
+
+
+CSV = "idChemicals,Pubchem_CID,CAS,Name,IUPAC_name,Odor_notes,Odor_tags\n0,1,1-1-1,Vanillin,vanillin,sweet;vanilla,sweet\n"
+
+
+@pytest.fixture
+def odor_csv(tmp_path, pubchem_cache):
+    path = tmp_path / "withodors.csv"
+    path.write_text(CSV, encoding="utf-8")
+    odors.reset_odor_table()
+    yield path
+    odors.reset_odor_table()
+
+
+def test_snapshot_is_reused_across_processes(odor_csv, monkeypatch):
+    """
+    Check that the snapshot replaces the CSV parse, even after a touch that keeps the content
+    """
+    table = odors.load_odor_table(odor_csv)
+    assert table["Name"] == ["Vanillin"] and table["Odor_notes"] == ["sweet;vanilla"]
+    assert odors._snapshot_path(odor_csv).exists()
+
+    def fail(path):
+        raise AssertionError("CSV parsed again")
+
+    monkeypatch.setattr(odors, "_read_csv", fail)
+    odors.reset_odor_table()  # as in a new process
+    os.utime(odor_csv, ns=(1, 1))
+    assert odors.load_odor_table(odor_csv)["CAS"] == ["1-1-1"]
+
+
+def test_snapshot_is_rebuilt_when_csv_changes(odor_csv):
+    """
+    Check that editing the CSV invalidates both the in-process table and the snapshot
+    """
+    odors.load_odor_table(odor_csv)
+    odor_csv.write_text(CSV + "1,2,2-2-2,Coumarin,coumarin,,\n", encoding="utf-8")
+    table = odors.load_odor_table(odor_csv)
+    assert table["Name"] == ["Vanillin", "Coumarin"]
+    assert table["Odor_notes"][1] is None
+
+
+def test_snapshot_follows_cache_settings(odor_csv, pubchem_cache):
+    """
+    Check that no snapshot is written with the cache off, and that clearing the cache removes it
+    """
+    pubchem_cache.configure_cache(mode="off")
+    assert odors.load_odor_table(odor_csv)["Name"] == ["Vanillin"]
+    assert not odors._snapshot_path(odor_csv).exists()
+
+    pubchem_cache.configure_cache(mode="on")
+    odors.reset_odor_table()
+    odors.load_odor_table(odor_csv)
+    assert odors._snapshot_path(odor_csv).parent == pubchem_cache.cache_dir()
+    assert odors._snapshot_path(odor_csv).exists()
+
+    pubchem_cache.clear_cache()
+    assert not odors._snapshot_path(odor_csv).exists()
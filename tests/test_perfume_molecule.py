@@ -1,4 +1,4 @@
-from perfumeme.perfume_molecule import odor_molecule_perfume, match_mol_to_odor, match_molecule_to_perfumes, what_notes, get_mol_from_odor
+from perfumeme.perfume_molecule import odor_molecule_perfume, odor_molecule_perfume_many, match_molecules_to_perfumes, get_mols_from_odors, what_notes_many, match_mol_to_odor, match_molecule_to_perfumes, what_notes, get_mol_from_odor
 import pytest 
 
 def test_match_molecule_to_perfume():
@@ -77,4 +77,29 @@ def test_get_mol_from_odor():
     #Test with an odor not in the database
     odor_1 = "love"
     expected_output_1 = "No molecules found that have this odor."
-    assert get_mol_from_odor(odor_1) == expected_output_1
\ No newline at end of file
+    assert get_mol_from_odor(odor_1) == expected_output_1
+
+def test_odor_molecule_perfume_many():
+    """
+    Check that the batch form returns, for each molecule, what odor_molecule_perfume returns
+    """
+    mols = ["methyl anthranilate", "Iron", "coumarin"]
+    results = odor_molecule_perfume_many(mols)
+    assert list(results) == mols
+    assert all(results[mol] == odor_molecule_perfume(mol) for mol in mols)
+    assert results["Iron"] == "No perfumes found containg this molecule."
+
+
+def test_batch_queries():
+    """
+    Check that the batch queries return, per input, what the single-item functions return
+    """
+    mols = ["methyl anthranilate", "Iron"]
+    assert match_molecules_to_perfumes(mols) == {mol: match_molecule_to_perfumes(mol) for mol in mols}
+
+    odors = ["orange", "love"]
+    assert get_mols_from_odors(odors) == {odor: get_mol_from_odor(odor) for odor in odors}
+
+    perfumes = ["La nuit de l'Homme", "Iron"]
+    assert what_notes_many(perfumes, "top") == {"La nuit de l'Homme": ["SAGE ESSENCE"], "Iron": "Perfume not found."}
+    assert what_notes_many(["Libre"], "middle") == {"Libre": "Invalid note type. Please use 'top', 'heart', or 'base'."}
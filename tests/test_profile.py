@@ -0,0 +1,128 @@
+from perfumeme.profile import extract_profile, smell_verdict, ALL_FIELDS, EVAPORATION_FIELDS
+
+
+def _section(heading, strings=(), subsections=()):
+    section = {"TOCHeading": heading}
+    if strings:
+        section["Information"] = [{"Value": {"StringWithMarkup": [{"String": s} for s in strings]}}]
+    if subsections:
+        section["Section"] = list(subsections)
+    return section
+
+
+RECORD = [
+    _section("Names and Identifiers", ["Colorless liquid with a floral odor"]),
+    _section("Chemical and Physical Properties", subsections=[
+        _section("Experimental Properties", subsections=[
+            _section("Boiling Point", ["198 °C"]),
+            _section("Vapor Pressure", ["0.16 mmHg at 23.5 °C"]),
+            _section("Heat of Vaporization", ["62.4 kJ/mol"]),
+        ]),
+    ]),
+    _section("Safety and Hazards", subsections=[
+        _section("Hazards Identification", subsections=[_section("Skin Sensitization")]),
+    ]),
+]
+
+
+def test_extract_profile_all_fields():
+    """
+    Check that one traversal fills every field, and records where each value came from
+    """
+    profile = extract_profile(RECORD)
+    assert profile.has_smell is True
+    assert profile.skin_hazard is True
+    assert profile.vapor_pressure == 0.16
+    assert profile.vapor_pressure_temp == 23.5
+    assert profile.boiling_point == 198.0
+    assert profile.enthalpy_vap == 62400.0
+    assert profile.fields == set(ALL_FIELDS)
+    assert profile.sources["vapor_pressure"] == "Chemical and Physical Properties > Experimental Properties > Vapor Pressure"
+    assert profile.sources["skin"] == "Safety and Hazards > Hazards Identification > Skin Sensitization"
+
+
+def test_extract_profile_stops_early():
+    """
+    Check that the sections are consumed only until the requested fields are settled
+    """
+    visited = []
+
+    def sections():
+        for section in RECORD:
+            visited.append(section["TOCHeading"])
+            yield section
+
+    profile = extract_profile(sections(), EVAPORATION_FIELDS)
+    assert profile.boiling_point == 198.0
+    assert profile.skin_hazard is False
+    assert visited == ["Names and Identifiers", "Chemical and Physical Properties"]
+
+
+def test_extract_profile_odorless_and_missing():
+    """
+    Check that an odorless mention wins and that absent values stay None
+    """
+    profile = extract_profile([_section("Physical Description", ["Odorless white powder"])])
+    assert profile.has_smell is False
+    assert profile.skin_hazard is False
+    assert profile.vapor_pressure is None and profile.boiling_point is None
+
+
+def test_extract_profile_reads_irrelevant_sections_for_smell():
+    """
+    Check that a smell keyword found only under a skipped heading such as "Literature" still counts,
+    and that such sections are skipped when the smell is not requested
+    """
+    record = [
+        _section("Names and Identifiers", ["Linalool"]),
+        _section("Literature", ["A study of its sweet floral scent"]),
+        _section("Patents", subsections=[_section("Toxicity", subsections=[_section("Skin Irritation")])]),
+    ]
+    assert extract_profile(record).has_smell is True
+    assert extract_profile(record, {"skin"}).sources == {}
+
+
+def test_extract_profile_irrelevant_sections_do_not_depend_on_order():
+    """
+    Check that a skin heading under an irrelevant section is ignored whether or not the smell was found before it
+    """
+    odor = _section("Names and Identifiers", ["Colorless liquid with a floral odor"])
+    patents = _section("Patents", subsections=[_section("Toxicity", subsections=[_section("Skin Irritation")])])
+
+    for record in ([odor, patents], [patents, odor]):
+        profile = extract_profile(record)
+        assert profile.has_smell is True
+        assert profile.skin_hazard is False
+
+
+def test_extract_profile_keeps_original_selection_rules():
+    """
+    Check that a °F boiling point wins over °C ones wherever it is, and that the last enthalpy found wins
+    """
+    record = [
+        _section("Chemical and Physical Properties", subsections=[
+            _section("Experimental Properties", subsections=[
+                _section("Boiling Point", ["198 °C"]),
+                _section("Heat of Vaporization", ["50.0 kJ/mol"]),
+            ]),
+            _section("Other Experimental Properties", subsections=[
+                _section("Boiling Point", ["392 °F", "200 °C"]),
+                _section("Enthalpy of Vaporization", ["62.4 kJ/mol"]),
+            ]),
+        ]),
+        _section("Safety and Hazards", subsections=[_section("Boiling Point", ["10 °F"])]),
+    ]
+    profile = extract_profile(record, EVAPORATION_FIELDS)
+    assert profile.boiling_point == 200.0
+    assert profile.enthalpy_vap == 62400.0
+    assert profile.sources["enthalpy"] == "Chemical and Physical Properties > Other Experimental Properties > Enthalpy of Vaporization"
+
+
+def test_smell_verdict():
+    """
+    Check the single-pass matcher: odorless phrases win anywhere in the string, odor words must be whole words
+    """
+    assert smell_verdict("Sweet floral scent") is True
+    assert smell_verdict("Strong odor, later described as odorless") is False
+    assert smell_verdict("Aromatic hydrocarbon") is None
+    assert smell_verdict("Colourless liquid") is None
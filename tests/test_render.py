@@ -0,0 +1,31 @@
+import numpy as np
+
+from perfumeme.evaporation import EvaporationProfile, evaporation_curves
+from perfumeme.render import render_evaporation, render_many
+
+
+def _profile(query, boiling_point):
+    times = np.linspace(0, 25, 300)
+    curves, models = evaporation_curves([{"boiling_point": boiling_point}], times)
+    return EvaporationProfile(query, None, boiling_point, None, None, models[0], times, curves[0] if models[0] else None)
+
+
+def test_render_evaporation_formats():
+    """
+    Check that a profile renders to PNG and SVG bytes, and that a profile without curve gives None
+    """
+    profile = _profile("linalool", 198.0)
+    assert render_evaporation(profile).startswith(b"\x89PNG")
+    svg = render_evaporation(profile, format="svg", note="Note: HEART NOTE")
+    assert b"<svg" in svg
+    assert render_evaporation(_profile("water", None)) is None
+
+
+def test_render_many_in_processes():
+    """
+    Check that parallel rendering keeps the order of the profiles
+    """
+    profiles = [_profile(f"mol{i}", 150.0 + 10 * i) for i in range(4)] + [_profile("none", None)]
+    images = render_many(profiles, format="svg", max_workers=2, chunksize=2)
+    assert len(images) == 5 and images[-1] is None
+    assert all(b"mol%d" % i in images[i] for i in range(4))
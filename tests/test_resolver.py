@@ -0,0 +1,27 @@
+from perfumeme.resolver import local_lookup, resolver_stats, reset_resolver
+from perfumeme.utils import resolve_input_to_smiles_and_cid
+import pytest
+
+
+def test_local_lookup():
+    """
+    Check that names, IUPAC names, CAS numbers and SMILES of known molecules resolve offline, and that hits and misses are counted
+    """
+    reset_resolver()
+    assert local_lookup("Citronellol") == ("CC(CCC=C(C)C)CCO", 8842)
+    assert local_lookup("3,7-dimethyloct-6-en-1-ol")[1] == 8842
+    assert local_lookup("68916-43-8")[1] == 8842
+    assert local_lookup("OCCC(C)CCC=C(C)C") == ("OCCC(C)CCC=C(C)C", 8842)
+    assert local_lookup("formaldehyde") == (None, 712)
+    assert local_lookup("unobtainium") is None
+
+    stats = resolver_stats()
+    assert stats["hits"] == 5 and stats["misses"] == 1
+
+
+def test_resolve_known_molecule_offline(pubchem_stub):
+    """
+    Check that a molecule of the local index is resolved without any request to PubChem
+    """
+    assert resolve_input_to_smiles_and_cid("linalool") == ("CC(=CCCC(C)(C=C)O)C", 6549)
+    assert pubchem_stub.requests == []
@@ -0,0 +1,38 @@
+from perfumeme import session
+from perfumeme.utils import get_cid_from_smiles, get_smiles
+import pytest
+
+
+def test_configure_session():
+    """
+    Check that the settings are applied to the pooled session and that defaults can be restored
+    """
+    settings = session.configure_session(pool_size=3, connect_timeout=1.5, read_timeout=4, gzip=False)
+    assert settings["pool_size"] == 3
+    assert session.default_timeout() == (1.5, 4)
+
+    s = session.get_session()
+    assert s is session.get_session()
+    assert s.get_adapter("https://pubchem.ncbi.nlm.nih.gov")._pool_maxsize == 3
+    assert s.headers["Accept-Encoding"] == "identity"
+
+    session.reset_session()
+    assert session.default_timeout() == (5.0, 30.0)
+
+
+def test_helpers_share_one_connection(pubchem_stub):
+    """
+    Check that consecutive helpers go through the shared session and reuse the same connection
+    """
+    pubchem_stub.routes["/rest/pug/compound/name/geraniol/property/IsomericSMILES/JSON"] = (
+        200, {"PropertyTable": {"Properties": [{"CID": 637566, "IsomericSMILES": "CC(=CCC/C(=C/CO)/C)C"}]}}
+    )
+    pubchem_stub.routes["/rest/pug/compound/smiles/cids/JSON"] = (200, {"IdentifierList": {"CID": [637566]}})
+
+    assert get_smiles("geraniol") == "CC(=CCC/C(=C/CO)/C)C"
+    assert get_cid_from_smiles("CC(=CCC/C(=C/CO)/C)C") == 637566
+
+    assert [r["method"] for r in pubchem_stub.requests] == ["GET", "POST"]
+    assert all(r["headers"]["Connection"] == "keep-alive" for r in pubchem_stub.requests)
+    pool = session.get_session().get_adapter(session.PUBCHEM_BASE_URL).poolmanager
+    assert len(pool.pools) == 1
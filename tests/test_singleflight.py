@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import time
+
+from perfumeme.async_functions import async_get_pubchem_record_sections
+from perfumeme.utils import get_pubchem_record_sections
+from perfumeme.singleflight import AsyncSingleFlight
+import pytest
+
+
+def _slow_record(path, body):
+    time.sleep(0.2)
+    return 200, {"Record": {"Section": [{"TOCHeading": "Odor"}]}}
+
+
+def test_threads_share_one_request(pubchem_stub, pubchem_cache):
+    """
+    Check that threads asking for the same record at the same time trigger a single request
+    """
+    pubchem_cache.configure_cache(mode="off")
+    pubchem_stub.routes["/rest/pug_view/data/compound/6549/JSON"] = _slow_record
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_pubchem_record_sections(6549))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [[{"TOCHeading": "Odor"}]] * 8
+    assert len(pubchem_stub.requests) == 1
+
+
+def test_coroutines_share_one_request(pubchem_stub, pubchem_cache):
+    """
+    Check that coroutines asking for the same record at the same time trigger a single request
+    """
+    pubchem_cache.configure_cache(mode="off")
+    pubchem_stub.routes["/rest/pug_view/data/compound/6549/JSON"] = _slow_record
+
+    async def main():
+        return await asyncio.gather(*(async_get_pubchem_record_sections(6549) for _ in range(8)))
+
+    assert asyncio.run(main()) == [[{"TOCHeading": "Odor"}]] * 8
+    assert len(pubchem_stub.requests) == 1
+
+
+def test_cancelling_first_caller_keeps_shared_call():
+    """
+    Check that cancelling the coroutine that started a shared call does not cancel it for the others
+    """
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "record"
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("k", slow))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.do("k", slow))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "record"
+    assert calls == [1]
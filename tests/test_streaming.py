@@ -0,0 +1,121 @@
+import io
+import json
+
+from perfumeme import streaming
+from perfumeme.streaming import iter_pruned_sections, stream_record_sections, configure_streaming
+from perfumeme.context import CompoundContext
+from perfumeme.main_functions import evaporation_trace
+from perfumeme.utils import get_pubchem_record_sections
+import pytest
+
+ijson = pytest.importorskip("ijson")
+
+
+RECORD = {"Record": {"RecordNumber": 6549, "Section": [
+    {"TOCHeading": "Names and Identifiers", "Description": "...", "Section": [
+        {"TOCHeading": "Synonyms", "Information": [{"ReferenceNumber": 1, "Value": {"StringWithMarkup": [{"String": "linalol", "Markup": [{"Start": 0}]}]}}]},
+    ]},
+    {"TOCHeading": "Chemical and Physical Properties", "Section": [
+        {"TOCHeading": "Experimental Properties", "Section": [
+            {"TOCHeading": "Boiling Point", "Information": [
+                {"ReferenceNumber": 2, "Value": {"StringWithMarkup": [{"String": "198 °C"}], "Unit": "°C"}},
+                {"ReferenceNumber": 3, "Value": {"Number": [198.5]}},
+            ]},
+            {"TOCHeading": "Vapor Pressure", "Information": [{"Value": {"StringWithMarkup": [{"String": "0.16 mmHg at 25 °C"}]}}]},
+        ]},
+    ]},
+    {"TOCHeading": "Spectral Information", "Section": [{"TOCHeading": "1D NMR Spectra"}]},
+]}}
+
+
+def test_pruned_sections_keep_only_headings_and_strings():
+    """
+    Check that the streaming parser keeps the section tree, headings and strings, and nothing else
+    """
+    raw = json.dumps(RECORD).encode("utf-8")
+    sections = list(iter_pruned_sections(io.BytesIO(raw)))
+
+    assert [s["TOCHeading"] for s in sections] == ["Names and Identifiers", "Chemical and Physical Properties", "Spectral Information"]
+    boiling = sections[1]["Section"][0]["Section"][0]
+    assert boiling == {"TOCHeading": "Boiling Point", "Information": [
+        {"Value": {"StringWithMarkup": [{"String": "198 °C"}]}}, {"Value": {"StringWithMarkup": []}},
+    ]}
+    assert "Description" not in sections[0]
+
+
+def test_pruned_sections_stop_early():
+    """
+    Check that parsing stops once every requested heading has been read
+    """
+    raw = json.dumps(RECORD).encode("utf-8")
+    sections = list(iter_pruned_sections(io.BytesIO(raw), stop_after=["Boiling Point"]))
+
+    assert [s["TOCHeading"] for s in sections] == ["Names and Identifiers", "Chemical and Physical Properties"]
+    experimental = sections[1]["Section"][0]
+    assert [s["TOCHeading"] for s in experimental["Section"]] == ["Boiling Point"]
+
+
+def test_stream_record_sections_fills_cache(pubchem_stub, pubchem_cache):
+    """
+    Check that a streamed record is cached and gives the same tree when read back from the cache
+    """
+    pubchem_stub.routes["/rest/pug_view/data/compound/6549/JSON"] = (200, RECORD)
+
+    streamed = stream_record_sections(6549)
+    assert stream_record_sections(6549) == streamed
+    assert len(pubchem_stub.requests) == 1
+    assert get_pubchem_record_sections(6549) == RECORD["Record"]["Section"]
+
+
+def test_context_stops_reading_stream_once_fields_are_settled(pubchem_stub, pubchem_cache, monkeypatch):
+    """
+    Check that in streaming mode the analysis stops parsing the record once its fields are found
+    """
+    pubchem_cache.configure_cache(mode="off")
+    filler = [{"TOCHeading": f"Filler {i}", "Information": [{"Value": {"StringWithMarkup": [{"String": "x" * 1000}]}}] * 20}
+              for i in range(100)]
+    properties = json.loads(json.dumps(RECORD["Record"]["Section"][1]))
+    properties["Section"][0]["Section"].append(
+        {"TOCHeading": "Heat of Vaporization", "Information": [{"Value": {"StringWithMarkup": [{"String": "62.4 kJ/mol"}]}}]}
+    )
+    record = {"Record": {"Section": [properties] + filler}}
+    pubchem_stub.routes["/rest/pug/compound/smiles/cids/JSON"] = (200, {"IdentifierList": {"CID": [999001]}})
+    pubchem_stub.routes["/rest/pug_view/data/compound/999001/JSON"] = (200, record)
+
+    read = []
+    real_read = streaming._TeeReader.read
+    monkeypatch.setattr(streaming._TeeReader, "read", lambda self, size=-1: read.append(len(data := real_read(self, size))) or data)
+    configure_streaming(True)
+    try:
+        context = CompoundContext("CCCCCCCCCCCCC(=O)OC1CCCCC1")
+        vp, bp, vp_temp, enthalpy, fig = evaporation_trace(context)
+    finally:
+        configure_streaming(False)
+
+    assert bp == 198.0 and vp == 0.16
+    assert sum(read) < len(json.dumps(record)) / 4
+    assert context._fragments == {}  # a partly read record is not kept as complete
+
+
+@pytest.mark.parametrize("sections", [
+    [{"TOCHeading": "Physical Description", "Description": "Odorless liquid.",
+      "Information": [{"Value": {"StringWithMarkup": [{"String": "Liquid with a sweet odor"}]}}]}],
+    [{"TOCHeading": "Organoleptic Properties", "Information": [{"Name": "Odor", "Value": {"Number": [1]}}]}],
+    RECORD["Record"]["Section"],
+])
+def test_streamed_profile_matches_full_parse(pubchem_stub, pubchem_cache, sections):
+    """
+    Check that a record gives the same profile whether it is parsed whole or streamed
+    """
+    pubchem_cache.configure_cache(mode="off")
+    pubchem_stub.routes["/rest/pug/compound/smiles/cids/JSON"] = (200, {"IdentifierList": {"CID": [999004]}})
+    pubchem_stub.routes["/rest/pug_view/data/compound/999004/JSON"] = (200, {"Record": {"Section": sections}})
+
+    full = CompoundContext("CCCCCCCCCCCCCC(=O)OC").profile()
+    configure_streaming(True)
+    try:
+        streamed = CompoundContext("CCCCCCCCCCCCCC(=O)OC").profile()
+    finally:
+        configure_streaming(False)
+
+    assert streamed == full
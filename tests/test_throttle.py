@@ -0,0 +1,82 @@
+import time
+
+from perfumeme import session
+from perfumeme.throttle import RateLimiter
+from perfumeme.utils import get_pubchem_record_sections
+import pytest
+
+
+def test_token_bucket_rate():
+    """
+    Check that the limiter lets a burst through and then spaces requests at the configured rate
+    """
+    limiter = RateLimiter(rate=20, burst=2)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.19
+
+
+def test_throttling_header_adapts_rate():
+    """
+    Check that the rate drops on a yellow/red PubChem status and recovers slowly once green
+    """
+    limiter = RateLimiter(rate=5)
+    limiter.observe({"X-Throttling-Control": "Request Count status: Yellow (60%), Request Time status: Green (10%), Service status: Green (20%)"})
+    assert limiter.rate == 2.5
+    limiter.observe({"X-Throttling-Control": "Request Count status: Red (80%), Request Time status: Green (10%), Service status: Green (20%)"})
+    assert limiter.rate == 1.25
+    limiter.observe({"X-Throttling-Control": "Request Count status: Green (5%), Request Time status: Green (1%), Service status: Green (20%)"})
+    assert 1.25 < limiter.rate < 1.5
+    limiter.observe({})
+    assert 1.25 < limiter.rate < 1.5
+
+
+def test_retry_after_on_503(pubchem_stub):
+    """
+    Check that a 503 with Retry-After is retried after the delay and that the rate is lowered
+    """
+    calls = []
+
+    def busy_then_ok(path, body):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return 503, {"Fault": "busy"}, {"Retry-After": "0.2"}
+        return 200, {"Record": {"Section": []}}
+
+    pubchem_stub.routes["/rest/pug_view/data/compound/1/JSON"] = busy_then_ok
+
+    assert get_pubchem_record_sections(1) == []
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.2
+    assert session.get_limiter().rate < 5
+
+    pubchem_stub.routes["/rest/pug_view/data/compound/2/JSON"] = (429, {"Fault": "busy"}, {"Retry-After": "0"})
+    session.configure_throttle(max_retries=1)
+    with pytest.raises(Exception):
+        get_pubchem_record_sections(2)
+
+
+def test_long_retry_after_is_capped(pubchem_stub):
+    """
+    Check that a huge Retry-After pauses the shared limiter for at most max_backoff seconds
+    """
+    calls = []
+
+    def busy_then_ok(path, body):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return 503, {"Fault": "busy"}, {"Retry-After": "3600"}
+        return 200, {"Record": {"Section": []}}
+
+    pubchem_stub.routes["/rest/pug_view/data/compound/3/JSON"] = busy_then_ok
+    session.configure_throttle(max_backoff=0.2)
+
+    assert get_pubchem_record_sections(3) == []
+    assert 0.2 <= calls[1] - calls[0] < 5
+
+    limiter = RateLimiter(rate=5, max_pause=0.1)
+    limiter.pause(3600)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start < 1
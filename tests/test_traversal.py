@@ -0,0 +1,59 @@
+from perfumeme.traversal import walk_sections, find_sections, heading_contains, prune_top_level
+
+
+TREE = [
+    {"TOCHeading": "Chemical and Physical Properties", "Section": [
+        {"TOCHeading": "Experimental Properties", "Section": [
+            {"TOCHeading": "Boiling Point"},
+            {"TOCHeading": "Vapor Pressure"},
+        ]},
+    ]},
+    {"TOCHeading": "Spectral Information", "Section": [{"TOCHeading": "Mass Spectrometry"}]},
+    {"TOCHeading": "Safety and Hazards"},
+]
+
+
+def test_walk_sections_order_and_pruning():
+    """
+    Check that sections come depth-first in record order with their paths, and that pruned subtrees are skipped
+    """
+    paths = [path for _, path in walk_sections(TREE, prune=prune_top_level())]
+    assert paths == [
+        ("Chemical and Physical Properties",),
+        ("Chemical and Physical Properties", "Experimental Properties"),
+        ("Chemical and Physical Properties", "Experimental Properties", "Boiling Point"),
+        ("Chemical and Physical Properties", "Experimental Properties", "Vapor Pressure"),
+        ("Safety and Hazards",),
+    ]
+
+
+def test_find_sections_stops_early():
+    """
+    Check that the stop callback ends the walk without pulling further top-level sections
+    """
+    pulled = []
+
+    def sections():
+        for section in TREE:
+            pulled.append(section["TOCHeading"])
+            yield section
+
+    found = []
+    for section, _ in find_sections(sections(), heading_contains("boiling"), stop=lambda: bool(found)):
+        found.append(section)
+    assert [s["TOCHeading"] for s in found] == ["Boiling Point"]
+    assert pulled == ["Chemical and Physical Properties"]
+
+
+def test_walk_sections_leave_callback():
+    """
+    Check that leave is called once a section and its subsections are done, before the next section
+    """
+    events = []
+    for _, path in walk_sections(TREE[:1], leave=lambda path: events.append(("leave", path[-1]))):
+        events.append(("visit", path[-1]))
+    assert events == [
+        ("visit", "Chemical and Physical Properties"), ("visit", "Experimental Properties"),
+        ("visit", "Boiling Point"), ("leave", "Boiling Point"), ("visit", "Vapor Pressure"), ("leave", "Vapor Pressure"),
+        ("leave", "Experimental Properties"), ("leave", "Chemical and Physical Properties"),
+    ]
@@ -1,4 +1,4 @@
-from perfumeme.utils import resolve_input_to_smiles_and_cid , get_odor, get_smiles, get_cid_from_smiles
+from perfumeme.utils import resolve_input_to_smiles_and_cid , get_odor, get_odors, get_smiles, get_cid_from_smiles, classify_input, canonicalize_smiles, resolve_many
 import pytest 
 
 
@@ -46,4 +46,84 @@ def test_resolve_input_to_smiles_and_cid():
 def test_get_odor():
 
     expected = "allspice;bacon;cinnamyl;clove;dry;floral;ham;honey;phenolic;pungent;savory;smoky;spicy;sweet;warm;woody"
-    assert get_odor("eugenol") == expected
\ No newline at end of file
+    assert get_odor("eugenol") == expected
+
+
+def test_get_odors():
+    """
+    Check the batch lookup: case-insensitive names, notes split into lists, and the set of names not found
+    """
+    odors, missing = get_odors(["Eugenol", "not a molecule"])
+    assert odors["Eugenol"][:3] == ["allspice", "bacon", "cinnamyl"]
+    assert missing == {"not a molecule"}
+
+
+def test_classify_input():
+    """
+    Check that SMILES and names are told apart locally, and that equivalent SMILES share one canonical form
+    """
+    assert classify_input("CC(CCC=C(C)C)CCO") == "smiles"
+    assert classify_input("O") == "smiles"
+    assert classify_input("linalool") == "name"
+    assert classify_input("methyl anthranilate") == "name"
+    assert classify_input("Water") == "name"
+
+    assert canonicalize_smiles("CC(CCC=C(C)C)CCO") == canonicalize_smiles("OCCC(C)CCC=C(C)C")
+
+
+def test_resolve_name_skips_smiles_request(pubchem_stub):
+    """
+    Check that a name is resolved with a single request, without a failed SMILES POST first
+    """
+    pubchem_stub.routes["/rest/pug/compound/name/perfumemol/property/IsomericSMILES/JSON"] = (
+        200, {"PropertyTable": {"Properties": [{"CID": 5365703, "IsomericSMILES": "C1CCCCCC(=O)OCCCCCCC=CCC1"}]}}
+    )
+    assert resolve_input_to_smiles_and_cid("perfumemol") == ("C1CCCCCC(=O)OCCCCCCC=CCC1", 5365703)
+    assert [r["method"] for r in pubchem_stub.requests] == ["GET"]
+
+
+def test_resolve_many(pubchem_stub):
+    """
+    Check that a batch is deduplicated, that CID-only local hits share one batch request, and that results keep the input order with per-item errors
+    """
+    def cid_properties(path, body):
+        assert body == "cid=712%2C612"
+        return 200, {"PropertyTable": {"Properties": [
+            {"CID": 612, "IsomericSMILES": "CC(C(=O)O)O"}, {"CID": 712, "IsomericSMILES": "C=O"},
+        ]}}
+
+    pubchem_stub.routes["/rest/pug/compound/cid/property/IsomericSMILES/JSON"] = cid_properties
+    pubchem_stub.routes["/rest/pug/compound/name/perfumemol/property/IsomericSMILES/JSON"] = (
+        200, {"PropertyTable": {"Properties": [{"CID": 5365703, "IsomericSMILES": "C1CCCCCC(=O)OCCCCCCC=CCC1"}]}}
+    )
+
+    inputs = ["linalool", "formaldehyde", "perfumemol", "lactic acid", "linalool ", "unobtainium"]
+    results = resolve_many(inputs)
+
+    assert [r["input"] for r in results] == inputs
+    assert [r["cid"] for r in results] == [6549, 712, 5365703, 612, 6549, None]
+    assert results[1]["smiles"] == "C=O"
+    assert results[5]["error"] is not None and results[0]["error"] is None
+    assert len(pubchem_stub.requests) == 3
+
+
+def test_resolve_many_accepts_a_generator():
+    """
+    Check that a generator of inputs gives one result per input, like a list
+    """
+    results = resolve_many(name for name in ["linalool", "linalool "])
+
+    assert [r["input"] for r in results] == ["linalool", "linalool "]
+    assert [r["cid"] for r in results] == [6549, 6549]
+
+
+def test_classify_input_keeps_rdkit_log_levels():
+    """
+    Check that parsing inputs with RDKit does not change its process-wide log levels
+    """
+    from rdkit import rdBase
+
+    before = rdBase.LogStatus()
+    classify_input("not a smiles (((")
+    classify_input("CCO")
+    assert rdBase.LogStatus() == before